@@ -1,11 +1,152 @@
 import re
+from collections import namedtuple
 
+from widgetastic.exceptions import NoSuchElementException
 from widgetastic.utils import ParametrizedLocator
 from widgetastic.widget import ParametrizedView
 from widgetastic.widget import Text
 from widgetastic.widget import View
 from widgetastic.xpath import quote
 
+from widgetastic_patternfly4.scripts import CHANGE_FUNCTIONS
+from widgetastic_patternfly4.scripts import DOM_FUNCTIONS
+from widgetastic_patternfly4.scripts import REACT_FUNCTIONS
+
+# Reads the text, color and hidden state of all legend items. The result is remembered by the
+# caller and served again until a MutationObserver sees the chart re-render.
+LEGEND_SNAPSHOT = (
+    DOM_FUNCTIONS
+    + CHANGE_FUNCTIONS
+    + REACT_FUNCTIONS
+    + """
+    var root = arguments[0], labels = arguments[1], icons = arguments[2], token = arguments[3];
+    // the legend entry Victory renders the label for, from the props React keeps on the node
+    function legendDatum(el) {
+        for (var fiber = fiberOf(el); fiber; fiber = fiber.return) {
+            var props = fiber.memoizedProps;
+            if (props && props.datum) {
+                return props.datum;
+            }
+        }
+        return null;
+    }
+    var key = changeToken(root, "__wtLegend");
+    if (key === token) {
+        return null;
+    }
+    var iconNodes = icons ? findAll(icons, root) : [];
+    return {
+        token: key,
+        items: findAll(labels, root).map(function(el, i) {
+            var icon = iconNodes[i], color = null, datum = legendDatum(el);
+            if (icon) {
+                var style = getComputedStyle(icon);
+                color = style.fill || style.color;
+            }
+            return {
+                text: (el.textContent || "").trim(),
+                color: color,
+                hidden: datum ? !!(datum.symbol && datum.symbol.type === "eyeSlash") : null,
+            };
+        }),
+    };
+"""
+)
+
+# Reads the texts of all legend labels in the document, once and without remembering anything in
+# the page.
+READ_LEGEND_TEXTS = (
+    DOM_FUNCTIONS
+    + """
+    return findAll(arguments[0], document).map(function(el) {
+        return (el.textContent || "").trim();
+    });
+"""
+)
+
+# Reads the tooltip label of every chart path from the Victory props React keeps on the DOM node,
+# returns [{element, label, color}], label is null if the props could not be found.
+READ_DATA_POINTS = (
+    DOM_FUNCTIONS
+    + REACT_FUNCTIONS
+    + """
+    var root = arguments[0], items = arguments[1];
+    function label(el) {
+        var fiber = fiberOf(el), datum = null, index = null, data = null;
+        for (; fiber; fiber = fiber.return) {
+            var props = fiber.memoizedProps;
+            if (!props) {
+                continue;
+            }
+            if (datum === null && props.datum) {
+                datum = props.datum;
+                index = props.index;
+                data = props.data;
+                continue;
+            }
+            if (datum !== null && props.labels) {
+                try {
+                    if (typeof props.labels === "function") {
+                        return String(props.labels({datum: datum, index: index, data: data}));
+                    }
+                    if (Array.isArray(props.labels) && index !== undefined) {
+                        return String(props.labels[index]);
+                    }
+                } catch (e) {}
+                break;
+            }
+        }
+        if (datum === null || datum.name === undefined) {
+            return null;
+        }
+        var value = datum._y !== undefined ? datum._y : datum.y;
+        return datum.name + ": " + value;
+    }
+    return findAll(items, root).map(function(el) {
+        return {element: el, label: label(el), color: getComputedStyle(el).fill};
+    });
+"""
+)
+
+LegendItem = namedtuple("LegendItem", ["text", "label", "value", "color", "hidden"])
+LegendItem.__doc__ = """A legend item of a chart.
+
+``text`` is the full text of the legend label, ``label`` and ``value`` are parsed from it.
+
+``hidden`` is read from the legend entry in the Victory props of the label. A series counts as
+hidden when the symbol type of its entry is ``eyeSlash``, which is how the Patternfly interactive
+legend (``getInteractiveLegendItemStyles``) marks a hidden series. It is None if the props are not
+available, e.g. in a production build without React internals on the nodes.
+"""
+
+
+def legend_snapshot(view, label_locator, icon_locator, parse):
+    """Returns a tuple of :py:class:`LegendItem` of all legend items in the view.
+
+    The snapshot is read in one script and remembered on the view until the chart re-renders.
+
+    Args:
+        view: The chart (or legend) view the locators are relative to.
+        label_locator: Locator of the legend labels.
+        icon_locator: Locator of the legend icons, matched with the labels by position.
+        parse: Callable returning ``(label, value)`` parsed from a label text.
+    """
+    result = view.browser.execute_script(
+        LEGEND_SNAPSHOT,
+        view,
+        label_locator,
+        icon_locator,
+        getattr(view, "_legend_token", None),
+        silent=True,
+    )
+    if result is not None:
+        view._legend_token = result["token"]
+        view._legend_snapshot = tuple(
+            LegendItem(item["text"], *parse(item["text"]), item["color"], item["hidden"])
+            for item in result["items"]
+        )
+    return view._legend_snapshot
+
 
 class Legend(ParametrizedView):
     """Represents Legend of chart."""
@@ -26,19 +167,23 @@ class Legend(ParametrizedView):
     # Need to overwrite as per need.
     LEGEND_ITEM_REGEX = re.compile(r"(\d+)\s(\w.*)|(\w.*)\s(\d+)")
 
+    @classmethod
+    def snapshot(cls, chart):
+        """Returns the :py:class:`LegendItem` snapshot of all legends of the chart."""
+        return legend_snapshot(
+            chart, cls.LEGEND_LABEL_ITEMS, cls.LEGEND_ICON_ITEMS, cls._get_legend_item
+        )
+
     @property
-    def _legend_color_map(self):
-        _data = {}
-
-        for icon, label_el in zip(
-            self.browser.elements(self.LEGEND_ICON_ITEMS),
-            self.browser.elements(self.LEGEND_LABEL_ITEMS),
-        ):
-            color = icon.value_of_css_property("fill")
-            if not color:
-                color = icon.value_of_css_property("color")
-            _data[self.browser.text(label_el)] = color
-        return _data
+    def _item(self):
+        items = self.snapshot(self.parent)
+        for item in items:
+            if item.text == self.label_text:
+                return item
+        for item in items:
+            if self.label_text in item.text:
+                return item
+        raise NoSuchElementException(f"Could not find the legend {self.label_text!r}")
 
     @classmethod
     def _get_legend_item(cls, text):
@@ -56,17 +201,25 @@ class Legend(ParametrizedView):
     @property
     def label(self):
         """Returns the label of a Legend"""
-        return self._get_legend_item(self.browser.text(self.LEGEND_LABEL))[0]
+        return self._item.label
 
     @property
     def value(self):
         """Returns the value of a Legend"""
-        return self._get_legend_item(self.browser.text(self.LEGEND_LABEL))[1]
+        return self._item.value
 
     @property
     def color(self):
         """Returns the color of a Legend"""
-        return self._legend_color_map.get(self.browser.text(self.LEGEND_LABEL))
+        return self._item.color
+
+    @property
+    def hidden(self):
+        """Returns True if the series of a Legend is hidden, None if it cannot be told.
+
+        See :py:class:`LegendItem` for how the hidden state is read.
+        """
+        return self._item.hidden
 
     def click(self):
         """Click on a Legend"""
@@ -75,10 +228,11 @@ class Legend(ParametrizedView):
     @classmethod
     def all(cls, browser):
         """Returns a list of all items"""
-        return [(browser.text(el),) for el in browser.elements(cls.LEGEND_LABEL_ITEMS)]
+        texts = browser.execute_script(READ_LEGEND_TEXTS, cls.LEGEND_LABEL_ITEMS, silent=True)
+        return [(text,) for text in texts]
 
     def __repr__(self):
-        return f"Legend({self.browser.text(self.LEGEND_LABEL)})"
+        return f"Legend({self.label_text})"
 
 
 class DataPoint:
@@ -118,6 +272,9 @@ class BulletChart(View):
     ITEMS = ".//*[name()='g']/*[name()='path' and not(contains(@style, 'type:square'))]"
     TOOLTIP_REGEX = re.compile(r"(.*?): ([\d]+)")
     APPLY_OFFSET = True
+    # Read the data points from the chart props instead of hovering every item for its tooltip.
+    # Hovering is still used for the items the props could not be found for.
+    HOVER_FREE = True
 
     tooltip = Text(
         ".//*[name()='svg' and contains(@aria-labelledby, 'victory-container')]/"
@@ -147,14 +304,19 @@ class BulletChart(View):
         dy = int(height / offset_denominator) if (width > 10 and height > 10) else 0
         return dx, dy
 
+    @property
+    def legend_snapshot(self):
+        """Returns a tuple of :py:class:`LegendItem` of all legends."""
+        return Legend.snapshot(self)
+
     @property
     def legends(self):
-        return [leg for leg in self._legends]
+        return [self._legends(item.text) for item in self.legend_snapshot]
 
     @property
     def legend_names(self):
         """Return all legend names."""
-        return [leg.label for leg in self.legends]
+        return [item.label for item in self.legend_snapshot]
 
     def get_legend(self, label):
         """Get specific Legend object.
@@ -163,34 +325,58 @@ class BulletChart(View):
             label: Name of legend label.
         """
         try:
-            return next(leg for leg in self.legends if leg.label == label)
+            return next(
+                self._legends(item.text) for item in self.legend_snapshot if item.label == label
+            )
         except StopIteration:
             return None
 
+    def _data_point(self, text, color):
+        match = self.TOOLTIP_REGEX.match(text)
+        if match:
+            return DataPoint(label=match.groups()[0], value=int(match.groups()[1]), color=color)
+        return None
+
+    def _hover_data_point(self, el):
+        """Hovers the item and reads its data point from the tooltip."""
+        self.browser.move_to_element(el)
+        self.browser.click(el)
+
+        if self.APPLY_OFFSET:
+            dx, dy = self._offsets(el)
+            self.browser.move_by_offset(dx, dy)
+
+        return self._data_point(self.tooltip.text, el.value_of_css_property("fill"))
+
+    def _read_items(self):
+        """Returns a list of ``(element, tooltip label, color)`` of the chart items.
+
+        The label is None for the items it could not be read for without hovering.
+        """
+        if not self.HOVER_FREE:
+            return [(el, None, None) for el in self.browser.elements(self.ITEMS)]
+        return [
+            (item["element"], item["label"], item["color"])
+            for item in self.browser.execute_script(READ_DATA_POINTS, self, self.ITEMS, silent=True)
+        ]
+
     @property
     def data(self):
         """Read graph and returns all Data Point objects."""
         _data = []
-        # focus away from graph
-        self.parent_browser.move_to_element("//body")
-
-        for el in self.browser.elements(self.ITEMS):
-            self.browser.move_to_element(el)
-            self.browser.click(el)
-
-            if self.APPLY_OFFSET:
-                dx, dy = self._offsets(el)
-                self.browser.move_by_offset(dx, dy)
-
-            match = self.TOOLTIP_REGEX.match(self.tooltip.text)
-            if match:
-                _data.append(
-                    DataPoint(
-                        label=match.groups()[0],
-                        value=int(match.groups()[1]),
-                        color=el.value_of_css_property("fill"),
-                    )
-                )
+        focused_away = False
+
+        for el, label, color in self._read_items():
+            if label is not None:
+                data_point = self._data_point(label, color)
+            else:
+                if not focused_away:
+                    # focus away from graph
+                    self.parent_browser.move_to_element("//body")
+                    focused_away = True
+                data_point = self._hover_data_point(el)
+            if data_point:
+                _data.append(data_point)
         return _data
 
     def get_data_point(self, label):
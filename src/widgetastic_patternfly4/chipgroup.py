@@ -1,10 +1,13 @@
+from wait_for import TimedOutError
 from wait_for import wait_for
+from widgetastic.exceptions import NoSuchElementException
 from widgetastic.widget import ParametrizedLocator
 from widgetastic.widget import ParametrizedView
 from widgetastic.widget import Text
 from widgetastic.widget import View
 
 from .button import Button
+from .scripts import DOM_FUNCTIONS
 
 
 class ChipReadOnlyError(Exception):
@@ -25,11 +28,219 @@ CATEGORY_CLOSE = "./div[contains(@class, 'pf-c-chip-group__close')]/button"
 # For backwards compatibility
 OLD_GROUP_ROOT = ".//ul[contains(@class, 'pf-c-chip-group')]"
 TOOLBAR_GROUP_LABEL = "./li/*[contains(@class, 'pf-c-chip-group__label')]"
+# a category of the toolbar, the toolbar is a chip group too but has no label of its own
+TOOLBAR_GROUP = f"{OLD_GROUP_ROOT}[{TOOLBAR_GROUP_LABEL}]"
 STANDALONE_GROUP_LABEL = "./preceding-sibling::*[contains(@class, 'pf-c-chip-group__label')]"
 OLD_CHIP_ROOT = (
     ".//*[(self::div or self::li) and contains(@class, 'pf-c-chip') "
     "and not(contains(@class, 'pf-m-overflow'))]"
 )
+CHIP_CLOSE = ".//button[@aria-label='close']"
+OVERFLOW_CHIP_ROOT = (
+    ".//button[contains(@class, 'pf-c-chip') and contains(@class, 'pf-m-overflow')]"
+)
+
+# shared by the chip scripts, chip() returns [text, badge] of a chip with the badge stripped off
+CHIP_FUNCTIONS = (
+    DOM_FUNCTIONS
+    + """
+    function visible(el) {
+        return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    }
+    // drops the matches wrapping another match, e.g. a list item whose class contains pf-c-chip
+    function innermost(nodes) {
+        return nodes.filter(function(el) {
+            return !nodes.some(function(other) { return other !== el && el.contains(other); });
+        });
+    }
+    function chip(el, chipText, chipBadge) {
+        var textNode = find(chipText, el);
+        if (!textNode) {
+            return null;
+        }
+        var name = text(textNode), badgeNode = find(chipBadge, textNode), badge = null;
+        if (badgeNode) {
+            // the badge text is part of the text node, also while the badge is hidden
+            badge = text(badgeNode);
+            if (badge && name.endsWith(badge)) {
+                name = name.slice(0, name.length - badge.length).trim();
+            }
+            if (!visible(badgeNode)) {
+                badge = null;
+            }
+        }
+        return [name, badge];
+    }
+"""
+)
+
+CHIP_TEXTS = (
+    CHIP_FUNCTIONS
+    + """
+    var chipText = arguments[1], chipBadge = arguments[2];
+    return arguments[0].map(function(el) { return chip(el, chipText, chipBadge); });
+"""
+)
+
+READ_CHIPS = (
+    CHIP_FUNCTIONS
+    + """
+    var root = arguments[0], group = arguments[1], label = arguments[2], chipRoot = arguments[3],
+        chipText = arguments[4], chipBadge = arguments[5], overflow = arguments[6];
+    return (group ? findAll(group, root) : [root]).map(function(groupNode) {
+        var labelNode = label && find(label, groupNode);
+        var overflowNode = overflow && find(overflow, groupNode);
+        return {
+            label: labelNode ? text(labelNode) : null,
+            chips: innermost(findAll(chipRoot, groupNode)).map(function(el) {
+                return chip(el, chipText, chipBadge);
+            }).filter(function(data) { return data !== null; }),
+            more: !!overflowNode && /more/i.test(text(overflowNode)),
+        };
+    });
+"""
+)
+
+REMOVE_CHIPS = (
+    CHIP_FUNCTIONS
+    + """
+    var root = arguments[0], group = arguments[1], chipRoot = arguments[2],
+        chipText = arguments[3], chipBadge = arguments[4], chipClose = arguments[5],
+        names = arguments[6], timeout = arguments[7];
+    function chips() {
+        if (!root.isConnected) {
+            // the whole group is gone
+            return [];
+        }
+        var result = [];
+        (group ? findAll(group, root) : [root]).forEach(function(groupNode) {
+            innermost(findAll(chipRoot, groupNode)).filter(visible).forEach(function(el) {
+                var data = chip(el, chipText, chipBadge);
+                result.push({element: el, name: data ? data[0] : "", close: find(chipClose, el)});
+            });
+        });
+        return result;
+    }
+    function targets() {
+        return chips().filter(function(chip) {
+            return names === null || names.indexOf(chip.name.toLowerCase()) >= 0;
+        });
+    }
+    if (names !== null) {
+        names = names.map(function(name) { return name.toLowerCase(); });
+    }
+    var initial = targets(), found = initial.map(function(chip) {
+        return chip.name.toLowerCase();
+    });
+    var result = {
+        missing: names === null ? [] : names.filter(function(name) {
+            return found.indexOf(name) < 0;
+        }),
+        read_only: initial.filter(function(chip) { return !chip.close; }).map(function(chip) {
+            return chip.name;
+        }),
+        remaining: [],
+    };
+    if (result.missing.length || result.read_only.length) {
+        return result;
+    }
+    return new Promise(function(done) {
+        var clicked = [], deadline = Date.now() + timeout;
+        (function poll() {
+            var remaining = initial.length ? targets() : [];
+            if (names === null) {
+                // only the chips present at the start are removed
+                remaining = remaining.filter(function(chip) {
+                    return found.indexOf(chip.name.toLowerCase()) >= 0;
+                });
+            }
+            if (!remaining.length || Date.now() > deadline) {
+                result.remaining = remaining.map(function(chip) { return chip.name; });
+                return done(result);
+            }
+            remaining.forEach(function(chip) {
+                // a chip re-rendered into a new element gets its close button clicked again
+                if (chip.close && clicked.indexOf(chip.element) < 0) {
+                    clicked.push(chip.element);
+                    chip.close.click();
+                }
+            });
+            setTimeout(poll, 50);
+        })();
+    });
+"""
+)
+
+
+def _remove_chips(view, group_locator, chip_locator, names, timeout, chip_for_name):
+    """Clicks the close buttons of the chips in one script, which then waits for them to vanish.
+
+    Args:
+        view: The view holding the chips.
+        group_locator: Locator of a chip group relative to the view, None if the view is the group.
+        chip_locator: Locator of a chip, relative to a group.
+        names: Names of the chips to remove, None to remove all the chips.
+        timeout: Timeout in seconds for all the chips to disappear.
+        chip_for_name: Returns a chip widget for a chip name, used for ``ChipReadOnlyError``.
+    """
+    result = view.browser.execute_script(
+        REMOVE_CHIPS,
+        view,
+        group_locator,
+        chip_locator,
+        CHIP_TEXT,
+        CHIP_BADGE,
+        CHIP_CLOSE,
+        None if names is None else list(names),
+        timeout * 1000,
+        silent=True,
+    )
+    if result["missing"]:
+        raise ValueError(f"Could not find chips with names {result['missing']}")
+    if result["read_only"]:
+        raise ChipReadOnlyError(
+            chip_for_name(result["read_only"][0]), f"Chips {result['read_only']} are read-only"
+        )
+    if result["remaining"]:
+        raise TimedOutError(f"Chips {result['remaining']} did not disappear in {timeout} seconds")
+
+
+def _read_chips(view, group_locator, label_locator, chip_locator, overflow_locator=None):
+    """Reads the chips of one or more chip groups in one script.
+
+    Args:
+        view: The view holding the chip groups, or the chip group itself.
+        group_locator: Locator of a chip group relative to the view, None if the view is the group.
+        label_locator: Locator of the group label relative to a group, None if not labelled.
+        chip_locator: Locator of a chip relative to a group.
+        overflow_locator: Locator of the overflow chip relative to a group.
+
+    Returns:
+        A list of ``(label, [(text, badge)], more)`` for every group, ``more`` is True if the
+        group has a 'N more' overflow chip.
+    """
+    groups = view.browser.execute_script(
+        READ_CHIPS,
+        view,
+        group_locator,
+        label_locator,
+        chip_locator,
+        CHIP_TEXT,
+        CHIP_BADGE,
+        overflow_locator,
+        silent=True,
+    )
+    return [
+        (group["label"], [tuple(data) for data in group["chips"]], group["more"])
+        for group in groups
+    ]
+
+
+def _chips_dict(groups):
+    result = {}
+    for label, chips, _ in groups:
+        result.setdefault(label, []).extend(chips)
+    return result
 
 
 class _BaseChip(View):
@@ -41,22 +252,28 @@ class _BaseChip(View):
     _badge = Text(f"{CHIP_TEXT}/{CHIP_BADGE}")
     button = Button(**{"aria-label": "close"})
 
+    def _read_chip(self):
+        """Returns the text (without the badge) and the badge of the chip in one script."""
+        data = self.browser.execute_script(
+            CHIP_TEXTS, [self.__element__()], CHIP_TEXT, CHIP_BADGE, silent=True
+        )[0]
+        if data is None:
+            raise NoSuchElementException(f"Could not find the text of {self!r}")
+        return data
+
     @property
     def badge(self):
         """
         Return the text of the badge displayed on the chip, if it has a badge
         """
-        return self._badge.text if self._badge.is_displayed else None
+        return self._read_chip()[1] or None
 
     @property
     def text(self):
         """
         Return the text displayed on the chip
         """
-        if self.badge:
-            # If this chip has a badge, strip the badge off the end to return only the text
-            return self._text.text.rstrip(self.badge)
-        return self._text.text
+        return self._read_chip()[0]
 
     @property
     def is_displayed(self):
@@ -73,22 +290,19 @@ class Chip(ParametrizedView, _BaseChip):
     ROOT = ParametrizedLocator(
         f"{CHIP_ROOT}[{CHIP_TEXT}[starts-with(normalize-space(.), {{text|quote}})]]"
     )
-
-    @staticmethod
-    def _get_text_ignoring_badge(browser, element):
-        el = element
-        badge_elements = browser.elements(CHIP_BADGE, parent=el)
-        if badge_elements:
-            badge = browser.text(el)
-            return badge.rstrip(browser.text(badge_elements[0]))
-        return browser.text(el)
+    CHIP_LOCATOR = CHIP_ROOT
 
     @classmethod
     def all(cls, browser):
         """Returns a list of the text of each chip"""
+        elements = browser.elements(f"{cls.CHIP_LOCATOR}[{CHIP_TEXT}]")
+        if not elements:
+            return []
         return [
-            (cls._get_text_ignoring_badge(browser, el),)
-            for el in browser.elements(f"{CHIP_ROOT}/{CHIP_TEXT}")
+            (text,)
+            for text, _ in browser.execute_script(
+                CHIP_TEXTS, elements, CHIP_TEXT, CHIP_BADGE, silent=True
+            )
         ]
 
     def __init__(self, *args, **kwargs):
@@ -117,7 +331,7 @@ class OverflowChip(_BaseChip):
     The 'Show More'/'Show Less' button is essentially a special kind of chip
     """
 
-    ROOT = ".//button[contains(@class, 'pf-c-chip') and contains(@class, 'pf-m-overflow')]"
+    ROOT = OVERFLOW_CHIP_ROOT
 
     def _show_less_shown(self):
         return self.text.replace(" ", "").lower() == "showless"
@@ -154,6 +368,8 @@ class ChipGroup(View):
     """
 
     ROOT = ParametrizedLocator("{@locator}")
+    CHIP_LOCATOR = CHIP_ROOT
+    LABEL_LOCATOR = STANDALONE_GROUP_LABEL
 
     overflow = OverflowChip()
     chips = ParametrizedView.nested(Chip)
@@ -208,14 +424,29 @@ class ChipGroup(View):
         else:
             raise ValueError(f"Could not find chip with name '{name}'")
 
+    def remove_chips(self, names=None, timeout=3):
+        """Removes the chips with the given names (all chips by default) from the group.
+
+        All the close buttons are clicked at once and the removal is waited for only once.
+
+        Raises:
+            ValueError: if any of the chips is not found, nothing is removed then
+            ChipReadOnlyError: if any of the chips is read-only, nothing is removed then
+        """
+        self.get_chips()
+        _remove_chips(self, None, self.CHIP_LOCATOR, names, timeout, self.chips)
+
     def remove_all_chips(self):
         """Removes all chips from the group"""
-        for chip in self:
-            chip.remove()
+        self.remove_chips()
+
+    def read_chips(self):
+        """Returns a dict of the group label and a list of ``(text, badge)`` of its chips."""
+        self.get_chips()
+        return _chips_dict(_read_chips(self, None, self.LABEL_LOCATOR, self.CHIP_LOCATOR))
 
     def read(self):
-        self.logger.info(self.get_chips())
-        return [chip.text for chip in self]
+        return [text for chips in self.read_chips().values() for text, _ in chips]
 
 
 class CategoryChipGroup(ChipGroup):
@@ -227,6 +458,8 @@ class CategoryChipGroup(ChipGroup):
         f"{CATEGORY_GROUP_ROOT}[{CATEGORY_LABEL}[normalize-space(.)={{@_label|quote}}]]"
     )
 
+    LABEL_LOCATOR = CATEGORY_LABEL
+
     chips = ParametrizedView.nested(Chip)
     close_button = Button(locator=CATEGORY_CLOSE)
 
@@ -249,7 +482,15 @@ class CategoryChipGroup(ChipGroup):
     @classmethod
     def all(cls, browser):
         """Returns a list of all category labels."""
-        return [browser.text(el) for el in browser.elements(CATEGORY_LABEL)]
+        elements = browser.elements(CATEGORY_LABEL)
+        if not elements:
+            return []
+        return [
+            label
+            for label, _ in browser.execute_script(
+                CHIP_TEXTS, elements, ".", CHIP_BADGE, silent=True
+            )
+        ]
 
 
 # For backwards compatibility
@@ -257,14 +498,7 @@ class OldChip(Chip):
     ROOT = ParametrizedLocator(
         f"{OLD_CHIP_ROOT}[{CHIP_TEXT}[starts-with(normalize-space(.), {{text|quote}})]]"
     )
-
-    @classmethod
-    def all(cls, browser):
-        """Returns a list of the text of each chip"""
-        return [
-            (cls._get_text_ignoring_badge(browser, el),)
-            for el in browser.elements(f"{OLD_CHIP_ROOT}/{CHIP_TEXT}")
-        ]
+    CHIP_LOCATOR = OLD_CHIP_ROOT
 
 
 # For backwards compatibility
@@ -282,6 +516,7 @@ class OldOverflowChip(OverflowChip):
 
 # For backwards compatibility
 class StandAloneChipGroup(ChipGroup):
+    CHIP_LOCATOR = OLD_CHIP_ROOT
     chips = ParametrizedView.nested(OldChip)
     overflow = ParametrizedView.nested(OldOverflowChip)
 
@@ -296,6 +531,8 @@ class ChipGroupToolbarCategory(ParametrizedView, ChipGroup):
     ROOT = ParametrizedLocator(
         f"{OLD_GROUP_ROOT}[{TOOLBAR_GROUP_LABEL}[normalize-space(.)={{label|quote}}]]"
     )
+    CHIP_LOCATOR = OLD_CHIP_ROOT
+    LABEL_LOCATOR = CATEGORY_LABEL
 
     chips = ParametrizedView.nested(OldChip)
 
@@ -346,12 +583,33 @@ class ChipGroupToolbar(View):
     def __iter__(self):
         yield from self.get_groups()
 
+    def _read_groups(self):
+        return _read_chips(
+            self, TOOLBAR_GROUP, TOOLBAR_GROUP_LABEL, OLD_CHIP_ROOT, OVERFLOW_CHIP_ROOT
+        )
+
+    def _expand_groups(self):
+        """Expands the toolbar and every category with a 'N more' overflow chip.
+
+        Returns:
+            The groups as read by :py:func:`_read_chips` once everything is expanded.
+        """
+        self.get_groups()
+        groups = self._read_groups()
+        collapsed = [label for label, _, more in groups if more]
+        if collapsed:
+            for label in collapsed:
+                self.groups(label).show_more()
+            groups = self._read_groups()
+        return groups
+
+    def read_chips(self):
+        """Returns a dict of the category labels and lists of ``(text, badge)`` of their chips."""
+        return _chips_dict(self._expand_groups())
+
     def read(self):
         """Returns a dict of chips"""
-        groups = {}
-        for group in self:
-            groups[group.label] = group.read()
-        return groups
+        return {label: [text for text, _ in chips] for label, chips in self.read_chips().items()}
 
     def show_more(self):
         """Expands a chip group"""
@@ -361,8 +619,32 @@ class ChipGroupToolbar(View):
         """Collapses a chip group"""
         self.overflow.show_less()
 
+    def remove_chips(self, names=None, timeout=3):
+        """Removes the chips with the given names (all chips by default) from all the groups.
+
+        All the close buttons are clicked at once and the removal is waited for only once.
+
+        Raises:
+            ValueError: if any of the chips is not found, nothing is removed then
+            ChipReadOnlyError: if any of the chips is read-only, nothing is removed then
+        """
+        self._expand_groups()
+        # resolved per category, like _read_groups
+        _remove_chips(
+            self,
+            TOOLBAR_GROUP,
+            OLD_CHIP_ROOT,
+            names,
+            timeout,
+            lambda name: OldChip(self, additional_context={"text": name}),
+        )
+
+    def remove_all_chips(self):
+        """Removes all chips from all the groups"""
+        self.remove_chips()
+
     @property
     def has_chips(self):
         # If we delete all chips the ROOT is still shown thus we need to check if there are
         # any chips.
-        return self.read() != {}
+        return any(chips for _, chips, _ in self._read_groups())
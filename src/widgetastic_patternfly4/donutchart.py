@@ -1,5 +1,7 @@
 import re
 
+from wait_for import TimedOutError
+from widgetastic.exceptions import NoSuchElementException
 from widgetastic.widget import ClickableMixin
 from widgetastic.widget import ParametrizedLocator
 from widgetastic.widget import ParametrizedView
@@ -7,11 +9,82 @@ from widgetastic.widget import View
 from widgetastic.widget import Widget
 from widgetastic.xpath import quote
 
+from widgetastic_patternfly4.bulletchart import Legend
+from widgetastic_patternfly4.bulletchart import legend_snapshot
+from widgetastic_patternfly4.scripts import DOM_FUNCTIONS
+
+# readDonut() returns the circle labels and the legend entries with numeric values converted
+DONUT_FUNCTIONS = (
+    DOM_FUNCTIONS
+    + """
+    function readDonut(root, circleRoot, circleLabels, legendRoot, legendItems, itemRegex) {
+        var regex = new RegExp("^(?:" + itemRegex + ")");
+        var labels = [], legend = [];
+        findAll(circleRoot, root).slice(0, 1).forEach(function(circle) {
+            labels = findAll(circleLabels, circle).map(text);
+        });
+        findAll(legendRoot, root).slice(0, 1).forEach(function(node) {
+            legend = findAll(legendItems, node).map(function(el) {
+                var match = regex.exec(text(el));
+                if (!match) {
+                    return {label: text(el), value: null};
+                }
+                var value = Number(match[2]);
+                return {label: match[1], value: isFinite(value) ? value : match[2]};
+            });
+        });
+        return {labels: labels, legend: legend};
+    }
+"""
+)
+
+READ_DONUT = (
+    DONUT_FUNCTIONS
+    + """
+    return readDonut.apply(null, Array.prototype.slice.call(arguments, 0, 6));
+"""
+)
+
+# Resolves with the donut data once it differs from the previous data, or with null on timeout
+WAIT_DONUT_CHANGE = (
+    DONUT_FUNCTIONS
+    + """
+    var args = Array.prototype.slice.call(arguments, 0, 6), previous = arguments[6],
+        timeout = arguments[7];
+    function key(data) {
+        return JSON.stringify([
+            data.labels,
+            data.legend.map(function(item) { return [item.label, item.value]; }),
+        ]);
+    }
+    var previousKey = key(previous), data = readDonut.apply(null, args);
+    if (key(data) !== previousKey) {
+        return data;
+    }
+    return new Promise(function(done) {
+        var timer, observer = new MutationObserver(function() {
+            var data = readDonut.apply(null, args);
+            if (key(data) !== previousKey) {
+                finish(data);
+            }
+        });
+        function finish(data) {
+            observer.disconnect();
+            clearTimeout(timer);
+            done(data);
+        }
+        observer.observe(
+            args[0], {subtree: true, childList: true, attributes: true, characterData: true});
+        timer = setTimeout(function() { finish(null); }, timeout);
+    });
+"""
+)
+
 
 class DonutLegendItem(ParametrizedView, ClickableMixin):
     PARAMETERS = ("label_text",)
     ROOT = ParametrizedLocator(
-        ".//*[name()='text']" "/*[name()='tspan' and contains(., '{label_text}')]"
+        ".//*[name()='text']/*[name()='tspan' and contains(., {label_text|quote})]"
     )
     ALL_ITEMS = ".//*[name()='text']/*[name()='tspan']"
     LEGEND_ITEM_REGEX = re.compile(r"(.*?): ([\d]+)")
@@ -24,15 +97,27 @@ class DonutLegendItem(ParametrizedView, ClickableMixin):
         else:
             return text, None
 
+    @property
+    def _item(self):
+        for item in self.parent.snapshot:
+            if self.label_text in item.text:
+                return item
+        raise NoSuchElementException(f"Could not find the legend item {self.label_text!r}")
+
     @property
     def label(self):
         """Returns the label of a DonutLegendItem as a string"""
-        return self._get_legend_item(self.browser.text(self))[0]
+        return self._item.label
 
     @property
     def value(self):
         """Returns the value of a DonutLegendItem as a string"""
-        return self._get_legend_item(self.browser.text(self))[1]
+        return self._item.value
+
+    @property
+    def color(self):
+        """Returns the color of a DonutLegendItem"""
+        return self._item.color
 
     @classmethod
     def all(cls, browser):
@@ -45,13 +130,20 @@ class DonutLegend(View):
 
     item = ParametrizedView.nested(DonutLegendItem)
 
+    @property
+    def snapshot(self):
+        """Returns a tuple of :py:class:`LegendItem` of all items."""
+        return legend_snapshot(
+            self,
+            DonutLegendItem.ALL_ITEMS,
+            Legend.LEGEND_ICON_ITEMS,
+            DonutLegendItem._get_legend_item,
+        )
+
     @property
     def all_items(self):
         """Returns a list of all items, arranged as {label: value}"""
-        result = []
-        for i in self.item:
-            result.append({"label": i.label, "value": i.value})
-        return result
+        return [{"label": item.label, "value": item.value} for item in self.snapshot]
 
 
 class DonutCircle(View):
@@ -85,3 +177,40 @@ class DonutChart(View):
             self.locator = locator
         else:
             raise TypeError("You need to specify either id or locator")
+
+    def _script_args(self):
+        return (
+            self,
+            DonutCircle.ROOT,
+            DonutCircle.LABELS_LOCATOR,
+            DonutLegend.ROOT,
+            DonutLegendItem.ALL_ITEMS,
+            DonutLegendItem.LEGEND_ITEM_REGEX.pattern,
+        )
+
+    def read(self):
+        """Returns the circle labels and the legend items in one script.
+
+        Returns:
+            ``{"labels": [circle labels], "legend": [{"label": label, "value": value}]}``, the
+            legend values are converted to numbers.
+        """
+        return self.browser.execute_script(READ_DONUT, *self._script_args(), silent=True)
+
+    def wait_for_change(self, previous=None, timeout=10):
+        """Waits until the donut data differs from the previous data and returns the new data.
+
+        The donut is watched in the page, so there is no polling from the test.
+
+        Args:
+            previous: Data as returned by :py:meth:`read`, the current data if not specified.
+            timeout: Timeout in seconds.
+        """
+        if previous is None:
+            previous = self.read()
+        result = self.browser.execute_script(
+            WAIT_DONUT_CHANGE, *self._script_args(), previous, timeout * 1000, silent=True
+        )
+        if result is None:
+            raise TimedOutError(f"{self!r} did not change in {timeout} seconds")
+        return result
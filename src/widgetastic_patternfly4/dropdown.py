@@ -1,13 +1,289 @@
+from collections import namedtuple
 from contextlib import contextmanager
 
+from wait_for import TimedOutError
 from wait_for import wait_for_decorator
 from widgetastic.exceptions import NoSuchElementException
 from widgetastic.exceptions import UnexpectedAlertPresentException
 from widgetastic.utils import ParametrizedLocator
 from widgetastic.widget import Checkbox
 from widgetastic.widget import Widget
+from widgetastic.xpath import normalize_space
 from widgetastic.xpath import quote
 
+from .scripts import CHANGE_FUNCTIONS
+from .scripts import DOM_FUNCTIONS
+
+LOCATE_ITEM = (
+    DOM_FUNCTIONS
+    + """
+    var root = arguments[0], button = arguments[1], item = arguments[2], items = arguments[3],
+        timeout = arguments[4];
+    function visible(el) {
+        return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    }
+    return new Promise(function(done) {
+        var deadline = Date.now() + timeout, toggled = false;
+        (function attempt() {
+            var element = find(item, root);
+            if (element && visible(element)) {
+                return done({
+                    element: element,
+                    disabled: element.classList.contains("pf-m-disabled"),
+                    count: findAll(items, root).length,
+                });
+            }
+            if (Date.now() > deadline) {
+                return done(null);
+            }
+            // without a button the menu is being filtered, so wait for the item to show up
+            if (button && findAll(items, root).some(visible)) {
+                // the menu is open and the item is not in it
+                return done(null);
+            }
+            if (button && !toggled) {
+                var toggle = find(button, root);
+                if (!toggle || toggle.disabled || toggle.classList.contains("pf-m-disabled")) {
+                    return done(null);
+                }
+                toggled = true;
+                toggle.click();
+            }
+            setTimeout(attempt, 50);
+        })();
+    });
+"""
+)
+
+ITEMS_SNAPSHOT = (
+    DOM_FUNCTIONS
+    + CHANGE_FUNCTIONS
+    + """
+    var root = arguments[0], items = arguments[1], group = arguments[2], selected = arguments[3],
+        token = arguments[4];
+    var key = changeToken(root, "__wtItems");
+    if (key === token) {
+        return null;
+    }
+    var selectedNodes = selected ? findAll(selected, root) : [];
+    return {
+        token: key,
+        items: findAll(items, root).map(function(el) {
+            var groupNode = group ? find(group, el) : null;
+            return {
+                text: visibleText(el),
+                enabled: !(el.classList.contains("pf-m-disabled")
+                           || el.querySelector(".pf-m-disabled")),
+                selected: selectedNodes.some(function(node) { return el.contains(node); }),
+                group: groupNode ? visibleText(groupNode) : null,
+            };
+        }),
+    };
+"""
+)
+
+CLICK_AND_WAIT = (
+    DOM_FUNCTIONS
+    + """
+    var element = arguments[0], click = arguments[1], className = arguments[2],
+        present = arguments[3], timeout = arguments[4];
+    function reached() {
+        return element.classList.contains(className) === present;
+    }
+    if (reached()) {
+        return true;
+    }
+    var target = find(click, element);
+    if (!target || target.disabled || target.classList.contains("pf-m-disabled")) {
+        return false;
+    }
+    return new Promise(function(done) {
+        var timer, observer = new MutationObserver(function() {
+            if (reached()) {
+                finish(true);
+            }
+        });
+        function finish(result) {
+            observer.disconnect();
+            clearTimeout(timer);
+            done(result);
+        }
+        observer.observe(element, {attributes: true, attributeFilter: ["class"]});
+        timer = setTimeout(function() { finish(reached()); }, timeout);
+        target.click();
+        if (reached()) {
+            finish(true);
+        }
+    });
+"""
+)
+
+FILL_CHECKBOXES = (
+    DOM_FUNCTIONS
+    + """
+    var root = arguments[0], items = arguments[1], checkbox = arguments[2], values = arguments[3],
+        timeout = arguments[4], label = arguments[5], prefix = arguments[6];
+    var entries = null;
+    function index() {
+        entries = [];
+        findAll(items, root).forEach(function(el) {
+            var labelNode = label ? find(label, el) : el;
+            if (labelNode) {
+                // the same as normalize-space(.) of the label in ITEM_LOCATOR
+                entries.push({element: el, text: text(labelNode)});
+            }
+        });
+    }
+    function matching(name) {
+        // the first item in the page order, like the locator
+        return entries.find(function(entry) {
+            return prefix ? entry.text.indexOf(name) === 0 : entry.text === name;
+        });
+    }
+    function lookup(name) {
+        var entry = entries && matching(name);
+        if (!entry || !entry.element.isConnected) {
+            // not indexed yet or re-rendered, the old nodes are gone
+            index();
+            entry = matching(name);
+        }
+        return entry ? {element: entry.element, input: find(checkbox, entry.element)} : null;
+    }
+    return new Promise(function(done) {
+        var result = {changed: [], missing: [], disabled: [], failed: []}, queue = values.slice();
+        (function next() {
+            if (!queue.length) {
+                return done(result);
+            }
+            var name = queue[0][0], wanted = queue[0][1], entry = lookup(name);
+            queue.shift();
+            if (!entry || !entry.input) {
+                result.missing.push(name);
+                return next();
+            }
+            if (entry.input.checked === wanted) {
+                return next();
+            }
+            if (entry.input.disabled || entry.element.classList.contains("pf-m-disabled")) {
+                result.disabled.push(name);
+                return next();
+            }
+            function reached() {
+                var current = lookup(name);
+                return !!(current && current.input && current.input.checked === wanted);
+            }
+            entry.input.click();
+            if (reached()) {
+                result.changed.push(name);
+                return next();
+            }
+            // one at a time, the next click must see the state rendered by the previous one
+            var timer, observer = new MutationObserver(function() {
+                if (reached()) {
+                    finish(true);
+                }
+            });
+            function finish(changed) {
+                observer.disconnect();
+                clearTimeout(timer);
+                (changed ? result.changed : result.failed).push(name);
+                next();
+            }
+            observer.observe(
+                root, {subtree: true, childList: true, attributes: true, characterData: true});
+            timer = setTimeout(function() { finish(reached()); }, timeout);
+        })();
+    });
+"""
+)
+
+CHECKBOX_STATES = (
+    DOM_FUNCTIONS
+    + """
+    var root = arguments[0], items = arguments[1], checkbox = arguments[2];
+    var labels = [], checked = "";
+    findAll(items, root).forEach(function(el) {
+        var input = find(checkbox, el);
+        labels.push(visibleText(el));
+        checked += input && input.checked ? "1" : "0";
+    });
+    return {labels: labels, checked: checked};
+"""
+)
+
+DropdownItem = namedtuple("DropdownItem", ["text", "enabled", "selected", "group"])
+
+
+def click_and_wait_for_class(
+    browser, element, class_name, present=True, click_locator=".", timeout=3
+):
+    """Clicks once and waits until the element gains or loses the class, in one script.
+
+    A MutationObserver watches the class attribute of the element, so the state is not polled.
+
+    Args:
+        browser: Browser to use.
+        element: Element (or locator, widget) whose classes are watched.
+        class_name: The class to wait for.
+        present: Whether to wait for the class to appear (True) or to disappear (False).
+        click_locator: XPath of the element to click, relative to ``element``.
+        timeout: Timeout in seconds.
+
+    Returns:
+        Boolean - True if the requested state was reached, False if not or if the element to
+        click is disabled.
+    """
+    return browser.execute_script(
+        CLICK_AND_WAIT,
+        browser.element(element),
+        click_locator,
+        class_name,
+        present,
+        timeout * 1000,
+        silent=True,
+    )
+
+
+class CheckboxStates(namedtuple("CheckboxStates", ["labels", "checked"])):
+    """Compact state of a checkbox dropdown.
+
+    ``labels`` is a tuple of the item labels in the order of the page, ``checked`` is an integer
+    whose bit ``i`` is set if the item ``labels[i]`` is checked.
+    """
+
+    __slots__ = ()
+
+    def is_checked(self, label):
+        """Returns whether the item with the given label is checked."""
+        return bool(self.checked >> self.labels.index(label) & 1)
+
+    def as_dict(self):
+        """Returns a dictionary containing the selected status as bools."""
+        return {label: bool(self.checked >> i & 1) for i, label in enumerate(self.labels)}
+
+
+def read_checkboxes(widget):
+    """Reads the labels and checked states of an open checkbox dropdown in one script.
+
+    Args:
+        widget: The checkbox dropdown, needs ``ITEMS_LOCATOR`` and ``ITEM_CHECKBOX_LOCATOR``.
+
+    Returns:
+        :py:class:`CheckboxStates`
+    """
+    result = widget.browser.execute_script(
+        CHECKBOX_STATES,
+        widget,
+        widget.ITEMS_LOCATOR,
+        widget.ITEM_CHECKBOX_LOCATOR,
+        silent=True,
+    )
+    return CheckboxStates(
+        tuple(normalize_space(label) for label in result["labels"]),
+        # the first item is the lowest bit
+        int(result["checked"][::-1] or "0", 2),
+    )
+
 
 class DropdownDisabled(Exception):
     pass
@@ -21,6 +297,54 @@ class DropdownItemNotFound(Exception):
     pass
 
 
+def fill_checkboxes(
+    widget, values, not_found=DropdownItemNotFound, disabled=DropdownItemDisabled, timeout=3
+):
+    """Sets the checkboxes of an open checkbox dropdown to the given values in one script.
+
+    Items are matched the way the ``ITEM_LOCATOR`` of the widget does, by the whitespace-normalized
+    text of the ``ITEM_LABEL_LOCATOR`` of an item (the whole item if None), which has to equal the
+    name or, with ``ITEM_PREFIX_MATCH``, start with it. The current state of every item is compared
+    with the wanted one and only the changed checkboxes are clicked. Every click is verified, by a
+    MutationObserver, before the next one. Missing, disabled and unchanged items are reported
+    together in one exception afterwards.
+
+    Args:
+        widget: The checkbox dropdown, needs ``ITEMS_LOCATOR`` and ``ITEM_CHECKBOX_LOCATOR``.
+        values: A dictionary containing what items to select (True) or deselect (False)
+        not_found: Exception class raised for missing items.
+        disabled: Exception class raised for disabled or unchanged items.
+        timeout: Timeout in seconds for every checkbox to show its new state.
+
+    Returns:
+        Boolean - True if any checkbox changed, False if not.
+    """
+    result = widget.browser.execute_script(
+        FILL_CHECKBOXES,
+        widget,
+        widget.ITEMS_LOCATOR,
+        widget.ITEM_CHECKBOX_LOCATOR,
+        [[item, bool(value)] for item, value in values.items()],
+        timeout * 1000,
+        getattr(widget, "ITEM_LABEL_LOCATOR", None),
+        getattr(widget, "ITEM_PREFIX_MATCH", False),
+        silent=True,
+    )
+    problems = []
+    for key, description in [
+        ("missing", "not found"),
+        ("disabled", "disabled"),
+        ("failed", "did not change"),
+    ]:
+        if result[key]:
+            problems.append("{}: {}".format(description, ", ".join(map(repr, result[key]))))
+    if problems:
+        raise (not_found if result["missing"] else disabled)(
+            "Could not fill {!r}, items {}".format(widget, "; ".join(problems))
+        )
+    return bool(result["changed"])
+
+
 class BaseDropdown:
     """Represents the Patternfly dropdown.
 
@@ -34,6 +358,16 @@ class BaseDropdown:
     BUTTON_LOCATOR = ".//button[contains(@class, 'pf-c-dropdown__toggle')]"
     ITEMS_LOCATOR = ".//ul[contains(@class, 'pf-c-dropdown__menu')]/li"
     ITEM_LOCATOR = ".//*[contains(@class, 'pf-c-dropdown__menu-item') and normalize-space(.)={}]"
+    # relative to an item, None if the items are not grouped
+    ITEM_GROUP_LOCATOR = None
+    SELECTED_ITEMS_LOCATOR = None
+    # wait for the dropdown to open or close with a MutationObserver instead of polling
+    EVENT_DRIVEN_WAIT = False
+
+    _items_snapshot = ()
+    # number of the items in the menu, the last time an item was selected from the full menu
+    _option_count = 0
+    _items_token = None
 
     @contextmanager
     def opened(self):
@@ -45,9 +379,8 @@ class BaseDropdown:
     @property
     def is_enabled(self):
         """Returns if the dropdown itself is enabled and therefore interactive."""
-        return "disabled" not in self.browser.classes(
-            self.BUTTON_LOCATOR
-        ) or "pf-m-disabled" not in self.browser.classes(self.BUTTON_LOCATOR)
+        classes = self.browser.classes(self.BUTTON_LOCATOR)
+        return "disabled" not in classes or "pf-m-disabled" not in classes
 
     def _verify_enabled(self):
         if not self.is_enabled:
@@ -67,6 +400,9 @@ class BaseDropdown:
         self._verify_enabled()
         if self.is_open:
             return
+        if self.EVENT_DRIVEN_WAIT:
+            self._click_toggle(expanded=True)
+            return
 
         @wait_for_decorator(timeout=3)
         def _click():
@@ -82,19 +418,94 @@ class BaseDropdown:
         try:
             self._verify_enabled()
             if self.is_open:
-                self.browser.click(self.BUTTON_LOCATOR)
+                self._click_toggle(expanded=False)
         except (NoSuchElementException, DropdownDisabled):
             if ignore_nonpresent:
                 self.logger.info("%r hid so it was not possible to close it. But ignoring.", self)
             else:
                 raise
 
+    def _toggle_target(self):
+        """Returns the element carrying ``pf-m-expanded`` and the toggle locator relative to it."""
+        return self, self.BUTTON_LOCATOR
+
+    def _click_toggle(self, expanded, timeout=3):
+        """Clicks the toggle button.
+
+        With ``EVENT_DRIVEN_WAIT`` it also waits until the dropdown is expanded or collapsed. The
+        callers verify that the dropdown is enabled.
+        """
+        if not self.EVENT_DRIVEN_WAIT:
+            self.browser.click(self.BUTTON_LOCATOR)
+            return
+        element, click_locator = self._toggle_target()
+        if not click_and_wait_for_class(
+            self.browser,
+            element,
+            "pf-m-expanded",
+            present=expanded,
+            click_locator=click_locator,
+            timeout=timeout,
+        ):
+            raise TimedOutError(
+                "{!r} did not {} in {} seconds".format(
+                    self, "open" if expanded else "close", timeout
+                )
+            )
+
+    def _read_items(self):
+        """Returns a snapshot of the items of the open dropdown as a tuple of ``DropdownItem``.
+
+        The snapshot is collected by a single script and served again until the DOM of the
+        dropdown changes, which includes closing it.
+        """
+        result = self.browser.execute_script(
+            ITEMS_SNAPSHOT,
+            self,
+            self.ITEMS_LOCATOR,
+            self.ITEM_GROUP_LOCATOR,
+            self.SELECTED_ITEMS_LOCATOR,
+            self._items_token,
+            silent=True,
+        )
+        if result is not None:
+            self._items_token = result["token"]
+            self._items_snapshot = tuple(
+                DropdownItem(
+                    normalize_space(item["text"]),
+                    item["enabled"],
+                    item["selected"],
+                    normalize_space(item["group"]) if item["group"] is not None else None,
+                )
+                for item in result["items"]
+            )
+        return self._items_snapshot
+
+    def _snapshot_item(self, item, **kwargs):
+        """Returns the ``DropdownItem`` of the given item, None if it is not in the snapshot."""
+        if kwargs:
+            return None
+        for entry in self._read_items():
+            if entry.text == item:
+                return entry
+        return None
+
+    @property
+    def items_snapshot(self):
+        """Returns a tuple of ``DropdownItem`` with the text, enabled and selected state and the
+        group of every item."""
+        with self.opened():
+            return self._read_items()
+
     @property
     def items(self):
         """Returns a list of all dropdown items as strings."""
-        with self.opened():
-            result = [self.browser.text(el) for el in self.browser.elements(self.ITEMS_LOCATOR)]
-        return result
+        return [item.text for item in self.items_snapshot]
+
+    @property
+    def enabled_items(self):
+        """Returns a list of all enabled dropdown items as strings."""
+        return [item.text for item in self.items_snapshot if item.enabled]
 
     def has_item(self, item):
         """Returns whether the items exists.
@@ -135,16 +546,76 @@ class BaseDropdown:
         Returns:
             Boolean - True if enabled, False if not.
         """
-        self._verify_enabled()
-        el = self.item_element(item, close=False, **kwargs)
-        is_el_enabled = "pf-m-disabled" not in self.browser.classes(el)
+        self.open()
+        entry = self._snapshot_item(item, **kwargs)
+        if entry is None:
+            el = self.item_element(item, close=False, **kwargs)
+            is_el_enabled = "pf-m-disabled" not in self.browser.classes(el)
+        else:
+            is_el_enabled = entry.enabled
         if close:
             self.close()
         return is_el_enabled
 
+    def _item_locator(self, item, **kwargs):
+        """Returns the locator of the item for :py:meth:`_locate_item`.
+
+        Returns None when the item cannot be located by a locator relative to the dropdown.
+        """
+        if kwargs:
+            return None
+        return self.ITEM_LOCATOR.format(quote(item))
+
+    def _locate_item(self, item, timeout=3, toggle=True, **kwargs):
+        """Opens the dropdown if needed and looks the item up with a single script execution.
+
+        Args:
+            item: Name of the item.
+            timeout: Timeout in seconds.
+            toggle: Whether to open the dropdown. If False, the already open (e.g. filtered)
+                menu is waited on until the item shows up.
+
+        Returns:
+            A dictionary with the item ``element``, its ``disabled`` state and the ``count`` of
+            the items in the menu. None if the item could not be found this way.
+        """
+        locator = self._item_locator(item, **kwargs)
+        if locator is None:
+            return None
+        if toggle:
+            self._verify_enabled()
+        result = self.browser.execute_script(
+            LOCATE_ITEM,
+            self,
+            self.BUTTON_LOCATOR if toggle else None,
+            locator,
+            self.ITEMS_LOCATOR,
+            timeout * 1000,
+            silent=True,
+        )
+        if result is not None and toggle:
+            self._option_count = result["count"]
+        return result
+
+    def _disabled_item_error(self, item):
+        """Returns the exception for selecting the disabled item, while the dropdown is open."""
+        return DropdownItemDisabled(
+            'Item "{}" of {} "{}" is disabled\n'
+            "The following items are available: {}".format(
+                item,
+                type(self).__name__.lower(),
+                getattr(self, "text", None) or self.locator,
+                ";".join(entry.text for entry in self._read_items()),
+            )
+        )
+
     def item_select(self, item, handle_alert=None, **kwargs):
         """Opens the dropdown and selects the desired item.
 
+        Opening the dropdown, locating the item and checking whether it is disabled is done by a
+        single script. Only if that fails, the item is looked up the regular way, which raises the
+        appropriate exception.
+
         Args:
             item: Item to be selected
             handle_alert: How to handle alerts. None - no handling, True - confirm, False - dismiss.
@@ -154,19 +625,18 @@ class BaseDropdown:
         """
         self.logger.info("Selecting %r", item)
         try:
-            if not self.item_enabled(item, close=False, **kwargs):
-                raise DropdownItemDisabled(
-                    'Item "{}" of {} "{}" is disabled\n'
-                    "The following items are available: {}".format(
-                        item,
-                        type(self).__name__.lower(),
-                        getattr(self, "text", None) or self.locator,
-                        ";".join(self.items),
-                    )
-                )
-            self.browser.click(
-                self.item_element(item, close=False, **kwargs), ignore_ajax=handle_alert is not None
-            )
+            located = self._locate_item(item, **kwargs)
+            if located is None:
+                enabled = self.item_enabled(item, close=False, **kwargs)
+            else:
+                enabled = not located["disabled"]
+            if not enabled:
+                raise self._disabled_item_error(item)
+            if located is None:
+                element = self.item_element(item, close=False, **kwargs)
+            else:
+                element = located["element"]
+            self.browser.click(element, ignore_ajax=handle_alert is not None)
             if handle_alert is not None:
                 self.browser.handle_alert(cancel=not handle_alert, wait=10.0)
                 self.browser.plugin.ensure_page_safe()
@@ -214,6 +684,7 @@ class BaseGroupDropdown:
     ITEMS_LOCATOR = ".//section[@class='pf-c-dropdown__group']/ul/li"
     GROUPS_LOCATOR = ".//section[@class='pf-c-dropdown__group']/h1"
     GROUP_LOCATOR = ".//section[@class='pf-c-dropdown__group'][h1[normalize-space(.)={}]]"
+    ITEM_GROUP_LOCATOR = "./ancestor::section[@class='pf-c-dropdown__group'][1]/h1"
 
     @property
     def groups(self):
@@ -237,6 +708,19 @@ class BaseGroupDropdown:
             )
         return super().item_element(item, close=close, **kwargs)
 
+    def _snapshot_item(self, item, group_name=None):
+        for entry in self._read_items():
+            if entry.text == item and (not group_name or entry.group == group_name):
+                return entry
+        return None
+
+    def _item_locator(self, item, group_name=None):
+        locator = self.ITEM_LOCATOR.format(quote(item))
+        if group_name:
+            # ITEM_LOCATOR is relative, so it is appended without its leading dot
+            locator = self.GROUP_LOCATOR.format(quote(group_name)) + locator[1:]
+        return locator
+
     def item_select(self, item, group_name=None, handle_alert=None):
         """Opens the dropdown and selects the desired item. Implemented only for proper kwargs
         suggestions.
@@ -1,7 +1,181 @@
+from wait_for import TimedOutError
+from widgetastic.exceptions import NoSuchElementException
 from widgetastic.widget import GenericLocatorWidget
 from widgetastic.widget import TextInput
 
 from .button import Button
+from .scripts import DOM_FUNCTIONS
+
+DUAL_LIST_FUNCTIONS = (
+    DOM_FUNCTIONS
+    + """
+    // the items of the list in a pane, the pane is the available or the chosen side
+    function paneItems(root, pane, list, items) {
+        var paneNode = find(pane, root), listNode = paneNode && find(list, paneNode);
+        return listNode ? findAll(items, listNode) : [];
+    }
+    function isSelected(el) {
+        return el.getAttribute("aria-selected") === "true";
+    }
+"""
+)
+
+READ_DUAL_LIST = (
+    DUAL_LIST_FUNCTIONS
+    + """
+    var root = arguments[0], panes = arguments[1], title = arguments[2], list = arguments[3],
+        items = arguments[4], selectedOnly = arguments[5];
+    return panes.map(function(pane) {
+        var paneNode = find(pane, root), titleNode = paneNode && find(title, paneNode);
+        var nodes = paneItems(root, pane, list, items).filter(function(el) {
+            return !selectedOnly || isSelected(el);
+        });
+        return [titleNode ? text(titleNode) : null, nodes.map(text)];
+    });
+"""
+)
+
+# Selects the named items of a pane (or deselects all its selected items if names is null), one
+# click at a time, then optionally clicks the move button and waits for the items to leave.
+SELECT_ITEMS = (
+    DUAL_LIST_FUNCTIONS
+    + """
+    var root = arguments[0], pane = arguments[1], list = arguments[2], items = arguments[3],
+        names = arguments[4], move = arguments[5], timeout = arguments[6];
+    var byText = Object.create(null);
+    function index() {
+        byText = Object.create(null);
+        paneItems(root, pane, list, items).forEach(function(el) {
+            var name = text(el);
+            if (!(name in byText)) {
+                byText[name] = el;
+            }
+        });
+    }
+    function lookup(name) {
+        if (!byText[name] || !byText[name].isConnected) {
+            // re-rendered, the old nodes are gone
+            index();
+        }
+        return byText[name];
+    }
+    index();
+    var wanted = names !== null, result = {missing: [], failed: [], remaining: []};
+    var targets = names !== null ? names : Object.keys(byText).filter(function(name) {
+        return isSelected(byText[name]);
+    });
+    result.missing = targets.filter(function(name) { return !byText[name]; });
+    if (result.missing.length) {
+        return result;
+    }
+    return new Promise(function(done) {
+        var deadline = Date.now() + timeout, queue = targets.slice();
+        function finish() {
+            if (!move || result.failed.length) {
+                return done(result);
+            }
+            find(move, root).click();
+            (function moved() {
+                index();
+                result.remaining = targets.filter(function(name) { return name in byText; });
+                if (!result.remaining.length || Date.now() > deadline) {
+                    return done(result);
+                }
+                setTimeout(moved, 20);
+            })();
+        }
+        (function next() {
+            if (!queue.length) {
+                return finish();
+            }
+            var name = queue.shift(), el = lookup(name);
+            if (isSelected(el) === wanted) {
+                return next();
+            }
+            // the click handler may sit on the row inside the list item, the click bubbles up
+            (el.firstElementChild || el).click();
+            // one at a time, the next click must see the state rendered by the previous one
+            function settle() {
+                var current = lookup(name);
+                if (current && isSelected(current) === wanted) {
+                    return next();
+                }
+                if (Date.now() > deadline) {
+                    result.failed.push(name);
+                    return next();
+                }
+                setTimeout(settle, 10);
+            }
+            Promise.resolve().then(settle);
+        })();
+    });
+"""
+)
+
+# Fills the search input of a pane the way React sees typing and waits for the list of the pane to
+# differ from the list before the search. The quiet period starts with that first difference and
+# restarts with every further mutation. Resolves with {missing, items}: missing names the pane or
+# input that could not be found, items are the texts once settled, the unchanged texts right away
+# if the input already holds the value or if the list did not start changing within the change
+# timeout, or null if it kept changing.
+SEARCH_ITEMS = (
+    DUAL_LIST_FUNCTIONS
+    + """
+    var root = arguments[0], pane = arguments[1], input = arguments[2], list = arguments[3],
+        items = arguments[4], value = arguments[5], quiet = arguments[6], timeout = arguments[7],
+        changeTimeout = arguments[8];
+    var paneNode = find(pane, root), inputNode = paneNode && find(pane + input, root);
+    if (!paneNode || !inputNode) {
+        return {missing: paneNode ? "input" : "pane", items: null};
+    }
+    function current() {
+        return paneItems(root, pane, list, items).map(text);
+    }
+    if (inputNode.value === value) {
+        // nothing to filter, React would not even see a change
+        return {missing: null, items: current()};
+    }
+    var before = JSON.stringify(current());
+    return new Promise(function(done) {
+        var changed = false, timer = null, guard, unchanged;
+        var observer = new MutationObserver(function() {
+            if (!changed) {
+                // e.g. the value attribute of the input, the list is not filtered yet
+                if (JSON.stringify(current()) === before) {
+                    return;
+                }
+                changed = true;
+            }
+            // still changing, start the quiet period again
+            clearTimeout(timer);
+            timer = setTimeout(function() { finish(current()); }, quiet);
+        });
+        function finish(result) {
+            observer.disconnect();
+            clearTimeout(timer);
+            clearTimeout(guard);
+            clearTimeout(unchanged);
+            done({missing: null, items: result});
+        }
+        unchanged = setTimeout(function() {
+            // e.g. a query matching every item, the list stays as it was
+            if (!changed) {
+                finish(current());
+            }
+        }, Math.min(changeTimeout, timeout));
+        guard = setTimeout(function() {
+            // the list never settled
+            finish(changed ? null : current());
+        }, Math.max(timeout, quiet));
+        observer.observe(
+            paneNode, {subtree: true, childList: true, attributes: true, characterData: true});
+        // the native setter and an input event, so that React picks the value up
+        Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set.call(
+            inputNode, value);
+        inputNode.dispatchEvent(new Event("input", {bubbles: true}));
+    });
+"""
+)
 
 
 class BaseDualListSelector:
@@ -78,52 +252,68 @@ class BaseDualListSelector:
 
     def read(self, selected_only=False):
         """Read items on left and right sides, if selected_only = True, read only selected items"""
-        data = dict()
-
-        if selected_only:
-            right_elements = self._selected_right_elements
-            left_elements = self._selected_left_elements
+        panes = self.browser.execute_script(
+            READ_DUAL_LIST,
+            self,
+            [self.AVAILABLE, self.CHOSEN],
+            self.SECTION_TITLE,
+            self.LIST_ITEMS,
+            self.ITEMS,
+            selected_only,
+            silent=True,
+        )
+        return {title: items for title, items in panes}
+
+    def _select_items(self, items, left_items, move=False, timeout=10):
+        """Selects the items of a side in one script, optionally moving them to the other side.
+
+        Args:
+            items: Texts of the items to select, None to deselect all the selected items.
+            left_items: Use the left side if True, the right side otherwise.
+            move: Click the move selected button afterwards and wait for the items to leave.
+            timeout: Timeout in seconds for the whole operation.
+        """
+        if move:
+            button = self.move_selected_right if left_items else self.move_selected_left
+            move_locator = button.locator
         else:
-            right_elements = self._right_elements
-            left_elements = self._left_elements
-
-        data[self._left_title] = [el.text for el in left_elements]
-        data[self._right_title] = [el.text for el in right_elements]
-        return data
+            move_locator = None
+        result = self.browser.execute_script(
+            SELECT_ITEMS,
+            self,
+            self.AVAILABLE if left_items else self.CHOSEN,
+            self.LIST_ITEMS,
+            self.ITEMS,
+            None if items is None else list(items),
+            move_locator,
+            timeout * 1000,
+            silent=True,
+        )
+        if result["missing"]:
+            raise ValueError(f"Items {result['missing']} are not available")
+        if result["failed"]:
+            raise TimedOutError(
+                f"Selection of items {result['failed']} did not change in {timeout} seconds"
+            )
+        if result["remaining"]:
+            raise TimedOutError(f"Items {result['remaining']} were not moved in {timeout} seconds")
 
     def reset_selected(self, left_items=True):
-        if left_items:
-            _elements = self._left_elements
-        else:
-            _elements = self._right_elements
-
-        for element in _elements:
-            if element.get_attribute("aria-selected") == "true":
-                element.click()
+        """Deselect all selected items. Defaults to left_items"""
+        self._select_items(None, left_items=left_items)
 
     def select(self, items, left_items=True):
-        """Select certain items based on text. Defaults to select left_items"""
-        if left_items:
-            _elements = self._left_elements
-        else:
-            _elements = self._right_elements
+        """Select certain items based on text. Defaults to select left_items
 
-        text_item_map = {self.browser.text(el): el for el in _elements}
-        for item in items:
-            el = text_item_map.get(item)
-            if not el:
-                raise ValueError("item not available. select proper one like raise an error")
-            self.browser.click(el)
+        All the items are looked up before anything is clicked, the missing ones are reported
+        together in one ``ValueError``.
+        """
+        self._select_items(items, left_items=left_items)
 
     def select_and_move(self, items, left_items=True):
         """Select and move certain items based on text. Defaults to select
         left_items and move to right"""
-        self.select(items, left_items=left_items)
-
-        if left_items:
-            self.move_selected_items_right()
-        else:
-            self.move_selected_items_left()
+        self._select_items(items, left_items=left_items, move=True)
 
 
 class DualListSelector(BaseDualListSelector, GenericLocatorWidget):
@@ -132,12 +322,53 @@ class DualListSelector(BaseDualListSelector, GenericLocatorWidget):
 
 class SearchDualListSelector(DualListSelector):
     INPUT = "//input"
-
-    def search(self, value, left_column=True):
-        """Fills a Dual list selector with the supplied value depending on column."""
-        if left_column:
-            text_input_widget = TextInput(self, locator=self.AVAILABLE + self.INPUT)
-        else:
-            text_input_widget = TextInput(self, locator=self.CHOSEN + self.INPUT)
-
-        text_input_widget.fill(value)
+    # seconds without any change of the pane, after the list changed, for the search results to be
+    # considered final
+    SEARCH_QUIET_PERIOD = 0.2
+    # seconds for the list to start changing, a search leaving the list as it was returns then
+    SEARCH_CHANGE_TIMEOUT = 1
+
+    def search(self, value, left_column=True, wait=True, timeout=5):
+        """Fills a Dual list selector with the supplied value depending on column.
+
+        Args:
+            value: The value to search for.
+            left_column: Search the left side if True, the right side otherwise.
+            wait: Fill and wait in the page until the list of the side changes and then stops
+                changing for ``SEARCH_QUIET_PERIOD``.
+            timeout: Timeout in seconds for the list to settle. The unchanged items are returned
+                right away if the input already holds the value, and after
+                ``SEARCH_CHANGE_TIMEOUT`` if the search leaves the list as it was.
+
+        Returns:
+            The texts of the filtered items of the side if ``wait`` is True, None otherwise.
+
+        Raises:
+            NoSuchElementException: if the side or its search input could not be found.
+            TimedOutError: if the list kept changing for the whole timeout.
+        """
+        pane = self.AVAILABLE if left_column else self.CHOSEN
+        if not wait:
+            TextInput(self, locator=pane + self.INPUT).fill(value)
+            return None
+
+        result = self.browser.execute_script(
+            SEARCH_ITEMS,
+            self,
+            pane,
+            self.INPUT,
+            self.LIST_ITEMS,
+            self.ITEMS,
+            value,
+            self.SEARCH_QUIET_PERIOD * 1000,
+            timeout * 1000,
+            self.SEARCH_CHANGE_TIMEOUT * 1000,
+            silent=True,
+        )
+        if result["missing"]:
+            raise NoSuchElementException(
+                f"Could not find the search {result['missing']} of {self!r}"
+            )
+        if result["items"] is None:
+            raise TimedOutError(f"Search results of {self!r} did not settle in {timeout} seconds")
+        return result["items"]
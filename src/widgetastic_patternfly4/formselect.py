@@ -1,6 +1,41 @@
+from collections import namedtuple
+
 from selenium.webdriver.support.ui import Select
-from widgetastic.exceptions import NoSuchElementException
 from widgetastic.widget import GenericLocatorWidget
+from widgetastic.xpath import normalize_space
+
+from .scripts import DOM_FUNCTIONS
+
+READ_OPTIONS = (
+    DOM_FUNCTIONS
+    + """
+    var select = arguments[0], locator = arguments[1];
+    var options = findAll(locator, select).map(function(option) {
+        var group = option.parentNode;
+        return {
+            text: option.text,
+            value: option.value,
+            disabled: option.disabled,
+            group_disabled: group.tagName === "OPTGROUP" && group.disabled,
+            selected: option.selected,
+        };
+    });
+    return {disabled: select.disabled, options: options};
+"""
+)
+
+
+class FormSelectOption(
+    namedtuple("FormSelectOption", ["text", "value", "disabled", "group_disabled", "selected"])
+):
+    """A row of the option table of the FormSelect."""
+
+    __slots__ = ()
+
+    @property
+    def is_enabled(self):
+        """Returns whether neither the option nor its optgroup is disabled."""
+        return not self.disabled and not self.group_disabled
 
 
 class FormSelectDisabled(Exception):
@@ -28,7 +63,6 @@ class BaseFormSelect:
     """
 
     ALL_OPTIONS_LOCATOR = ".//option"
-    PARENT_OPTION_GROUP = "./parent::optgroup"
 
     @property
     def is_enabled(self):
@@ -42,10 +76,33 @@ class BaseFormSelect:
         """
         return self.browser.get_attribute("aria-invalid", self) == "false"
 
+    def _read_options(self):
+        """Returns whether the FormSelect is enabled and its option table, in one script."""
+        result = self.browser.execute_script(
+            READ_OPTIONS, self, self.ALL_OPTIONS_LOCATOR, silent=True
+        )
+        options = tuple(
+            FormSelectOption(
+                normalize_space(option["text"]),
+                option["value"],
+                option["disabled"],
+                option["group_disabled"],
+                option["selected"],
+            )
+            for option in result["options"]
+        )
+        return not result["disabled"], options
+
+    @property
+    def option_table(self):
+        """Returns a tuple of :py:class:`FormSelectOption` with the text, value, disabled state
+        of the option and of its optgroup and the selected state of every option."""
+        return self._read_options()[1]
+
     @property
     def all_options(self):
         """Returns a list of all the options in the FormSelect."""
-        return [self.browser.text(el) for el in self.browser.elements(self.ALL_OPTIONS_LOCATOR)]
+        return [option.text for option in self.option_table]
 
     @property
     def all_enabled_options(self):
@@ -53,52 +110,60 @@ class BaseFormSelect:
 
         Options might be disabled by `disabled` attr in their WebElement or in parent optgroup
         element (if it exists)."""
-        result = []
-        all_option_elements = self.browser.elements(self.ALL_OPTIONS_LOCATOR)
-        for el in all_option_elements:
-            try:
-                group_disabled = (
-                    self.browser.get_attribute("disabled", self.PARENT_OPTION_GROUP, parent=el)
-                    is not None
-                )
-            except NoSuchElementException:
-                group_disabled = False
-            element_disabled = self.browser.get_attribute("disabled", el) is not None
-            if not group_disabled and not element_disabled:
-                result.append(self.browser.text(el))
-        return result
+        return [option.text for option in self.option_table if option.is_enabled]
 
     @property
     def _select_element(self):
         return Select(self.__element__())
 
-    def fill(self, value):
+    def fill(self, value, by_value=False):
         """Select desired option in FormSelect.
 
+        Args:
+            value: Visible text or value of the option
+            by_value: Whether ``value`` is the value of the option instead of its visible text
+
+        Returns:
+            Boolean - True if the selected option changed, False if not.
+
         Raises:
             FormSelectDisabled: if FormSelect is disabled
             FormSelectOptionDisabled: if option or entire optgroup is disabled
             FormSelectOptionNotFound: if option not found
         """
-        if not self.is_enabled:
+        enabled, options = self._read_options()
+        if not enabled:
             raise FormSelectDisabled("{} is not enabled".format(repr(self)))
-        if value not in self.all_options:
+        key = "value" if by_value else "text"
+        matching = [option for option in options if getattr(option, key) == value]
+        if not matching:
             raise FormSelectOptionNotFound(
                 'Option "{}" not found in {}. Available options: {}'.format(
-                    value, repr(self), self.all_options
+                    value, repr(self), [getattr(option, key) for option in options]
                 )
             )
-        elif value not in self.all_enabled_options:
+        elif not any(option.is_enabled for option in matching):
             raise FormSelectOptionDisabled(
                 'Option "{}" is disabled in {}. Enabled options are: {}'.format(
-                    value, repr(self), self.all_enabled_options
+                    value,
+                    repr(self),
+                    [getattr(option, key) for option in options if option.is_enabled],
                 )
             )
-        self._select_element.select_by_visible_text(value)
+        if any(option.selected for option in matching):
+            return False
+        if by_value:
+            self._select_element.select_by_value(value)
+        else:
+            self._select_element.select_by_visible_text(value)
+        return True
 
     def read(self):
         """Returns selected option."""
-        return self.browser.text(self._select_element.first_selected_option)
+        for option in self.option_table:
+            if option.selected:
+                return option.text
+        return None
 
     def __repr__(self):
         return "{}({!r})".format(type(self).__name__, self.locator)
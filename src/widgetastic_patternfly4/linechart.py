@@ -1,8 +1,78 @@
+from collections import namedtuple
+
 from widgetastic.widget import ParametrizedLocator
 from widgetastic.widget import View
 from widgetastic.xpath import quote
 
 from widgetastic_patternfly4.bulletchart import Legend
+from widgetastic_patternfly4.scripts import DOM_FUNCTIONS
+from widgetastic_patternfly4.scripts import REACT_FUNCTIONS
+
+# Reads the series from the Victory props React keeps on the line paths. The values are formatted
+# with the container labels callback, the same way the tooltip shows them.
+# Returns {x: [x labels], series: [[name, {x label: value}]]} or null if the props are not found.
+READ_SERIES = (
+    DOM_FUNCTIONS
+    + REACT_FUNCTIONS
+    + """
+    var root = arguments[0], paths = findAll(".//*[name()='path']", root);
+    function curve(fiber) {
+        var data = null, labels = null;
+        for (; fiber; fiber = fiber.return) {
+            var props = fiber.memoizedProps;
+            if (!props) {
+                continue;
+            }
+            if (data === null && Array.isArray(props.data) && props.interpolation !== undefined) {
+                data = props.data;
+            }
+            var container = props.containerComponent;
+            if (data !== null && container && container.props) {
+                labels = container.props.labels;
+                break;
+            }
+        }
+        return data && {data: data, labels: typeof labels === "function" ? labels : null};
+    }
+    var seen = [], xLabels = [], series = [];
+    for (var i = 0; i < paths.length; i++) {
+        var fiber = fiberOf(paths[i]), found = fiber && curve(fiber);
+        if (!found || seen.indexOf(found.data) !== -1) {
+            continue;
+        }
+        seen.push(found.data);
+        var name = null, values = {};
+        for (var j = 0; j < found.data.length; j++) {
+            var datum = found.data[j];
+            if (datum.name === undefined) {
+                return null;
+            }
+            name = datum.name;
+            var x = String(datum.x !== undefined ? datum.x : datum._x);
+            if (xLabels.indexOf(x) === -1) {
+                xLabels.push(x);
+            }
+            var value = datum.y !== undefined ? datum.y : datum._y;
+            if (found.labels) {
+                try {
+                    value = found.labels({datum: datum, index: j, data: found.data});
+                } catch (e) {}
+            }
+            values[x] = String(value);
+        }
+        if (name !== null) {
+            series.push([name, values]);
+        }
+    }
+    return series.length ? {x: xLabels, series: series} : null;
+"""
+)
+
+LineChartColumns = namedtuple("LineChartColumns", ["x_labels", "series"])
+LineChartColumns.__doc__ = """Columnar chart data, X-axis labels and a list of values per series.
+
+A value is None if the series has no data point for the respective X-axis label.
+"""
 
 
 class LineChart(View):
@@ -29,6 +99,10 @@ class LineChart(View):
     TOOLTIP_LABLES = ".//*[name()='g']/*[name()='text' and not(contains(@id, 'legend-label'))]"
     TOOLTIP_VALUES = ".//*[name()='g']/*[name()='text' and contains(@id, 'legend-label')]"
 
+    # Read the series from the chart props instead of hovering every X-axis label for its tooltip.
+    # Hovering is still used if the props could not be found.
+    HOVER_FREE = True
+
     _legends = View.nested(Legend)
 
     def __init__(self, parent=None, id=None, locator=None, logger=None):
@@ -41,15 +115,20 @@ class LineChart(View):
         else:
             self.locator = locator
 
+    @property
+    def legend_snapshot(self):
+        """Returns a tuple of :py:class:`LegendItem` of all legends."""
+        return Legend.snapshot(self)
+
     @property
     def legends(self):
         """Return object of Legends"""
-        return [leg for leg in self._legends]
+        return [self._legends(item.text) for item in self.legend_snapshot]
 
     @property
     def legend_names(self):
         """Return all legend names."""
-        return [leg.label for leg in self.legends]
+        return [item.label for item in self.legend_snapshot]
 
     def get_legend(self, label):
         """Get specific Legend object.
@@ -58,7 +137,9 @@ class LineChart(View):
             label: Name of legend label.
         """
         try:
-            return next(leg for leg in self.legends if leg.label == label)
+            return next(
+                self._legends(item.text) for item in self.legend_snapshot if item.label == label
+            )
         except StopIteration:
             return None
 
@@ -71,16 +152,63 @@ class LineChart(View):
         """Return X-Axis labels."""
         return list(self._x_axis_labels_map.keys())
 
-    def read(self, offset=(0, -100)):
+    def _read_series(self):
+        """Returns the chart data as :py:class:`LineChartColumns` or None if not readable."""
+        if not self.HOVER_FREE:
+            return None
+        result = self.browser.execute_script(READ_SERIES, self, silent=True)
+        if not result:
+            return None
+        return LineChartColumns(
+            result["x"],
+            {
+                name: [values.get(x_label) for x_label in result["x"]]
+                for name, values in result["series"]
+            },
+        )
+
+    def read(self, offset=(0, -100), columnar=False):
         """Read chart data.
 
-        Note: This method has some limitations as we are reading the tooltip for x-axis labels
-        with some offset. So only applicable for the chart which shows all Legend data in a single
-        tooltip for the respective x-axis label.
+        The data is read from the chart props in one script. If that is not possible, the tooltip
+        of every X-axis label is read instead.
+
+        Note: Reading the tooltips has some limitations as we are reading the tooltip for x-axis
+        labels with some offset. So only applicable for the chart which shows all Legend data in a
+        single tooltip for the respective x-axis label.
 
         Args:
             offset: offset to move the cursor from the x-axis label so that the tooltip can appear.
+            columnar: If True, return :py:class:`LineChartColumns` instead of a dict.
+
+        Returns:
+            ``{x_label: {series: value}}`` or :py:class:`LineChartColumns`.
         """
+        columns = self._read_series()
+        if columns is None:
+            data = self._hover_read(offset)
+            if not columnar:
+                return data
+            names = []
+            for label_data in data.values():
+                names.extend(name for name in label_data if name not in names)
+            return LineChartColumns(
+                list(data),
+                {name: [label_data.get(name) for label_data in data.values()] for name in names},
+            )
+        if columnar:
+            return columns
+        return {
+            x_label: {
+                name: values[index]
+                for name, values in columns.series.items()
+                if values[index] is not None
+            }
+            for index, x_label in enumerate(columns.x_labels)
+        }
+
+    def _hover_read(self, offset):
+        """Reads the chart data from the tooltip of every X-axis label."""
         _data = {}
 
         for lab_el in self._x_axis_labels_map.values():
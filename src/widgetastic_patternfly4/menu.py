@@ -3,6 +3,8 @@ from widgetastic.exceptions import NoSuchElementException
 from .dropdown import Dropdown
 from .dropdown import DropdownItemDisabled
 from .dropdown import DropdownItemNotFound
+from .dropdown import fill_checkboxes
+from .dropdown import read_checkboxes
 
 
 class MenuItemDisabled(DropdownItemDisabled):
@@ -47,11 +49,7 @@ class BaseMenu:
     @property
     def selected_items(self):
         """Returns a list of all selected items as strings."""
-        with self.opened():
-            result = [
-                self.browser.text(el) for el in self.browser.elements(self.SELECTED_ITEMS_LOCATOR)
-            ]
-        return result
+        return [item.text for item in self.items_snapshot if item.selected]
 
     @property
     def is_open(self):
@@ -68,6 +66,9 @@ class BaseMenu:
         """Returns True if the menu toggle itself is enabled and therefore interactive."""
         return self.IS_ALWAYS_OPEN or "disabled" not in self.browser.classes(self.BUTTON_LOCATOR)
 
+    def _toggle_target(self):
+        return self.BUTTON_LOCATOR, "."
+
     def close(self, ignore_nonpresent=False):
         """Close the menu
 
@@ -82,7 +83,7 @@ class BaseMenu:
                 self.logger.info("Tried to close %r but it's always open. Ignoring.", self)
                 return
             if self.is_open:
-                self.browser.click(self.BUTTON_LOCATOR)
+                self._click_toggle(expanded=False)
         except (NoSuchElementException, MenuItemDisabled):
             if ignore_nonpresent:
                 self.logger.info("%r hid so it was not possible to close it. But ignoring.", self)
@@ -100,24 +101,13 @@ class BaseMenu:
                 )
             )
 
-    def item_select(self, item):
-        """Opens the Menu and selects the desired item.
-
-        Args:
-            item: Item to be selected
-
-        Raises:
-            MenuItemDisabled: if item is disabled
-        """
-        try:
-            return super().item_select(item)
-        except DropdownItemDisabled:
-            raise MenuItemDisabled(
-                'Item "{}" of {} is disabled\n'
-                "The following items are available and enabled: {}".format(
-                    item, repr(self), self.enabled_items
-                )
+    def _disabled_item_error(self, item):
+        return MenuItemDisabled(
+            'Item "{}" of {} is disabled\n'
+            "The following items are available and enabled: {}".format(
+                item, repr(self), [entry.text for entry in self._read_items() if entry.enabled]
             )
+        )
 
     def fill(self, value):
         """Fills a Menu with a value or values."""
@@ -145,6 +135,10 @@ class BaseCheckboxMenu(BaseMenu):
     """
 
     ITEM_LOCATOR = ".//label[normalize-space(.)={}]/preceding-sibling::input"  # noqa
+    ITEM_CHECKBOX_LOCATOR = ".//input"
+    # how fill_checkboxes matches the items, the same way as ITEM_LOCATOR
+    ITEM_LABEL_LOCATOR = ".//label"
+    ITEM_PREFIX_MATCH = False
 
     def item_select(self, items, close=True):
         """Opens the Checkbox and selects the desired item.
@@ -188,33 +182,38 @@ class BaseCheckboxMenu(BaseMenu):
         """Fills a Checkbox with all items.
         Example dictionary: {"foo": True, "bar": False, "baz": True}
 
+        Only the checkboxes whose state differs are clicked, all in a single script.
+
         Args:
             items: A dictionary containing what items to select (True) or deselect (False)
+
+        Returns:
+            Boolean - True if any checkbox changed, False if not.
+
+        Raises:
+            MenuItemNotFound: if any of the items is missing
+            MenuItemDisabled: if any of the items is disabled or could not be changed
         """
         try:
-            for item, value in items.items():
-                if value:
-                    self.item_select(item, close=False)
-                else:
-                    self.item_deselect(item, close=False)
+            self.open()
+            return fill_checkboxes(
+                self, items, not_found=MenuItemNotFound, disabled=MenuItemDisabled
+            )
         finally:
             self.close()
 
+    @property
+    def checkbox_states(self):
+        """Returns the labels and checked states of all items as :py:class:`CheckboxStates`.
+
+        Unlike :py:meth:`read` it does not build a dictionary, which suits frequent polling.
+        """
+        with self.opened():
+            return read_checkboxes(self)
+
     def read(self):
         """Returns a dictionary containing the selected status as bools."""
-        selected = {}
-        with self.opened():
-            for el in self.browser.elements(self.ITEMS_LOCATOR):
-                item = self.browser.text(el)
-                try:
-                    # get the child element of the label
-                    selected[item] = self.browser.element(
-                        parent=el, locator="./input"
-                    ).is_selected()
-                except NoSuchElementException:
-                    selected[item] = False
-
-        return selected
+        return self.checkbox_states.as_dict()
 
     def _get_items(self, close=False):
         """Returns a list of all checkbox items as strings.
@@ -223,7 +222,7 @@ class BaseCheckboxMenu(BaseMenu):
             close: Close the dropdown when finished
         """
         self.open()
-        result = [self.browser.text(el) for el in self.browser.elements(self.ITEMS_LOCATOR)]
+        result = [item.text for item in self._read_items()]
 
         if close:
             self.close()
@@ -1,16 +1,83 @@
+from collections import namedtuple
 from collections import OrderedDict
 
-from wait_for import wait_for
 from widgetastic.exceptions import NoSuchElementException
 from widgetastic.utils import ParametrizedLocator
 from widgetastic.widget import Widget
+from widgetastic.xpath import normalize_space
 from widgetastic.xpath import quote
 
+from .scripts import CHANGE_FUNCTIONS
+from .scripts import DOM_FUNCTIONS
+from .scripts import ouia_safe_state
+from .scripts import wait_for_ouia_safe
+
+NAV_TREE = (
+    DOM_FUNCTIONS
+    + CHANGE_FUNCTIONS
+    + """
+    var root = arguments[0], items = arguments[1], subItemsRoot = arguments[2],
+        token = arguments[3];
+    function walk(container) {
+        return findAll(items, container).map(function(el) {
+            var li = el.parentNode, sub = find(subItemsRoot, li);
+            return {
+                text: el.textContent,
+                current: el.classList.contains("pf-m-current")
+                    || li.classList.contains("pf-m-current"),
+                expanded: li.classList.contains("pf-m-expanded"),
+                children: sub ? walk(sub) : null,
+            };
+        });
+    }
+    var key = changeToken(root, "__wtNav");
+    if (key === token) {
+        return null;
+    }
+    return {token: key, items: walk(root)};
+"""
+)
+
+NAV_RESOLVE = (
+    DOM_FUNCTIONS
+    + """
+    var root = arguments[0], items = arguments[1], subItemsRoot = arguments[2],
+        selected = arguments[3], levels = arguments[4];
+    var path = [], container = root;
+    for (var i = 0; i < levels.length && container; i++) {
+        var level = levels[i].replace(/[ \\t\\r\\n]+/g, " ").trim();
+        var link = findAll(items, container).find(function(el) {
+            return text(el) === level;
+        });
+        if (!link) {
+            break;
+        }
+        var li = link.parentNode;
+        path.push({li: li, expanded: li.classList.contains("pf-m-expanded")});
+        container = find(subItemsRoot, li);
+    }
+    return {
+        path: path,
+        selected: findAll(selected, root).map(function(el) { return el.innerText; }),
+    };
+"""
+)
+
+# children is None for an item without sub items root, otherwise a tuple of NavItem
+NavItem = namedtuple("NavItem", ["text", "current", "expanded", "children"])
+
 
 def check_nav_loaded(fn):
     def inner(self, *args, **kwargs):
+        if getattr(self, "_loaded_checked", False):
+            # already checked by the decorated method calling this one
+            return fn(self, *args, **kwargs)
         assert self.loaded
-        return fn(self, *args, **kwargs)
+        self._loaded_checked = True
+        try:
+            return fn(self, *args, **kwargs)
+        finally:
+            self._loaded_checked = False
 
     return inner
 
@@ -33,16 +100,16 @@ class BaseNavigation:
     SUB_ITEMS_ROOT = "./section"
     ITEM_MATCHING = "./ul/li[.//*[self::a or self::button][normalize-space(.)={}]]"
 
+    _tree = ()
+    _tree_token = None
+
     @property
     def loaded(self):
         """Returns a boolean detailing if the nav is loaded."""
-        out = self.browser.element(".").get_attribute("data-ouia-safe")
+        out = ouia_safe_state(self)
         if out == "false":
             self.logger.info("Navigation not ready yet")
-            wait_for(
-                lambda: self.browser.element(".").get_attribute("data-ouia-safe") == "true",
-                num_sec=10,
-            )
+            wait_for_ouia_safe(self, timeout=10)
         elif not out:
             self.logger.info("Navigation doesn't have 'data-ouia-safe' property")
         return True
@@ -52,43 +119,71 @@ class BaseNavigation:
         """Returns the current navigation item."""
         return self.currently_selected
 
-    @check_nav_loaded
-    def nav_links(self, *levels):
-        """Returns a list of all navigation items."""
-        if not levels:
-            return [
-                el.get_property("textContent").strip() for el in self.browser.elements(self.ITEMS)
-            ]
-        current_item = self
-        for i, level in enumerate(levels):
-            li = self.browser.element(
-                self.ITEM_MATCHING.format(quote(level.strip())), parent=current_item
+    @classmethod
+    def _build_tree(cls, items):
+        return tuple(
+            NavItem(
+                item["text"].strip(),
+                item["current"],
+                item["expanded"],
+                None if item["children"] is None else cls._build_tree(item["children"]),
             )
+            for item in items
+        )
+
+    def _read_tree(self):
+        """Returns the whole navigation tree as a tuple of ``NavItem``.
 
-            try:
-                current_item = self.browser.element(self.SUB_ITEMS_ROOT, parent=li)
-            except NoSuchElementException:
+        The tree is collected by a single script and served again until the DOM of the
+        navigation changes.
+        """
+        result = self.browser.execute_script(
+            NAV_TREE, self, self.ITEMS, self.SUB_ITEMS_ROOT, self._tree_token, silent=True
+        )
+        if result is not None:
+            self._tree_token = result["token"]
+            self._tree = self._build_tree(result["items"])
+        return self._tree
+
+    def _tree_items(self, levels):
+        """Returns the ``NavItem`` tuple under the given levels of the navigation tree."""
+        items = self._read_tree()
+        for i, level in enumerate(levels):
+            for item in items:
+                if normalize_space(item.text) == normalize_space(level):
+                    break
+            else:
+                raise NoSuchElementException(
+                    "Could not find {!r} in the navigation tree".format(levels[: i + 1])
+                )
+            if item.children is None:
                 if i == len(levels) - 1:
-                    return []
-                else:
-                    raise
-        return [
-            el.get_property("textContent").strip()
-            for el in self.browser.elements(self.ITEMS, parent=current_item)
-        ]
+                    return ()
+                raise NoSuchElementException(
+                    "{!r} has no sub items in the navigation tree".format(levels[: i + 1])
+                )
+            items = item.children
+        return items
+
+    @check_nav_loaded
+    def nav_links(self, *levels):
+        """Returns a list of all navigation items."""
+        return [item.text for item in self._tree_items(levels)]
 
     @check_nav_loaded
     def nav_item_tree(self, start=None):
         """Returns an ordered dict representing the navigation tree."""
-        start = start or []
-        result = OrderedDict()
-        for item in self.nav_links(*start):
-            sub_items = self.nav_item_tree(start=start + [item])
-            result[item] = sub_items or None
-        if result and all(value is None for value in result.values()):
-            # If there are no child nodes, then just make it a list
-            result = list(result.keys())
-        return result
+
+        def _subtree(items):
+            result = OrderedDict()
+            for item in items:
+                result[item.text] = _subtree(item.children or ()) or None
+            if result and all(value is None for value in result.values()):
+                # If there are no child nodes, then just make it a list
+                result = list(result.keys())
+            return result
+
+        return _subtree(self._tree_items(start or []))
 
     @property
     @check_nav_loaded
@@ -106,24 +201,28 @@ class BaseNavigation:
         """
         self.logger.info("Selecting %r in navigation", levels)
         force = kwargs.get("force", False)
-        if not force and list(levels) == self.currently_selected:
+        # the whole path and the current selection are resolved by one script
+        result = self.browser.execute_script(
+            NAV_RESOLVE,
+            self,
+            self.ITEMS,
+            self.SUB_ITEMS_ROOT,
+            self.CURRENTLY_SELECTED,
+            list(levels),
+            silent=True,
+        )
+        path = result["path"]
+        if len(path) < len(levels):
+            raise NavSelectionNotFound(
+                f"{levels} not found in navigation tree. "
+                f"Deepest matched level: {list(levels[:len(path)])}, "
+                f"could not find {levels[len(path)]!r}"
+            )
+        if not force and list(levels) == [normalize_space(text) for text in result["selected"]]:
             return
-        current_item = self
-        for i, level in enumerate(levels, 1):
-            try:
-                li = self.browser.element(
-                    self.ITEM_MATCHING.format(quote(level)), parent=current_item
-                )
-            except NoSuchElementException:
-                raise NavSelectionNotFound(
-                    f"{levels} not found in navigation tree. "
-                    f"Could not find element: '{self.ITEM_MATCHING.format(quote(level))}'"
-                )
-            if "pf-m-expanded" not in li.get_attribute("class").split():
-                self.browser.click(li)
-            if i == len(levels):
-                return
-            current_item = self.browser.element(self.SUB_ITEMS_ROOT, parent=li)
+        for level in path:
+            if not level["expanded"]:
+                self.browser.click(level["li"])
 
     def __repr__(self):
         return "{}({!r})".format(type(self).__name__, self.ROOT)
@@ -24,10 +24,7 @@ class BaseOptionsMenu:
     @property
     def selected_items(self):
         """Returns a list of all selected items in the options menu."""
-        with self.opened():
-            return [
-                self.browser.text(el) for el in self.browser.elements(self.SELECTED_ITEMS_LOCATOR)
-            ]
+        return [item.text for item in self.items_snapshot if item.selected]
 
 
 class OptionsMenu(BaseOptionsMenu, Dropdown):
@@ -1,7 +1,11 @@
 import math
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 
 from selenium.webdriver.common.keys import Keys
+from wait_for import wait_for
 from widgetastic.utils import ParametrizedLocator
 from widgetastic.widget import GenericLocatorWidget
 from widgetastic.widget import Text
@@ -9,6 +13,83 @@ from widgetastic.widget import TextInput
 from widgetastic.widget import View
 
 from .optionsmenu import OptionsMenu
+from .scripts import DOM_FUNCTIONS
+from .scripts import REACT_FUNCTIONS
+
+
+PAGINATION_STATE = (
+    DOM_FUNCTIONS
+    + REACT_FUNCTIONS
+    + """
+    var root = arguments[0], locators = arguments[1];
+    function optionalText(expr) {
+        var el = find(expr, root);
+        return el ? visibleText(el) : null;
+    }
+    function button(el) {
+        if (!el) {
+            return null;
+        }
+        return {
+            enabled: !el.disabled,
+            displayed: !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length),
+        };
+    }
+    // the perPage prop React keeps for the Pagination component
+    function perPageProp() {
+        for (var fiber = fiberOf(root); fiber; fiber = fiber.return) {
+            var props = fiber.memoizedProps;
+            if (props && typeof props.perPage === "number") {
+                return props.perPage;
+            }
+        }
+        return null;
+    }
+    var input = find(locators.current_page, root), items = optionalText(locators.items);
+    var next = button(find(locators.next, root)), perPage = perPageProp();
+    var range = items && items.split("of")[0].split("-").map(function(n) { return parseInt(n); });
+    if (perPage === null && range && range.length === 2) {
+        var page = input ? parseInt(input.value) : NaN;
+        if (next && next.enabled) {
+            // a full page is displayed
+            perPage = range[1] - range[0] + 1;
+        } else if (page > 1) {
+            // the last page, it starts right after the full pages before it
+            perPage = (range[0] - 1) / (page - 1);
+        }
+    }
+    return {
+        items: items,
+        current_page: input ? input.value : null,
+        total_pages: optionalText(locators.total_pages),
+        per_page: perPage,
+        first: button(find(locators.first, root)),
+        previous: button(find(locators.previous, root)),
+        next: next,
+        last: button(find(locators.last, root)),
+        options: button(find(locators.options, root)),
+    };
+"""
+)
+
+PaginationState = namedtuple(
+    "PaginationState",
+    [
+        "first_item",
+        "last_item",
+        "total_items",
+        "current_page",
+        "total_pages",
+        "per_page",
+        "is_first_enabled",
+        "is_previous_enabled",
+        "is_next_enabled",
+        "is_last_enabled",
+    ],
+)
+
+
+ShardTiming = namedtuple("ShardTiming", ["shard", "pages", "rows", "seconds"])
 
 
 class PaginationNavDisabled(Exception):
@@ -34,12 +115,83 @@ class BasePagination:
     _current_page = TextInput(locator=".//input[@aria-label='Current page']")
     _total_pages = Text(".//div[@class='pf-c-pagination__nav-page-select']/span")
 
+    _snapshot = None
+
+    def _from_snapshot(self, key):
+        """Returns the value read by the active :py:meth:`snapshot`, None if there is none."""
+        if self._snapshot is None:
+            return None
+        return self._snapshot.get(key)
+
+    @contextmanager
+    def snapshot(self):
+        """A context manager that serves the pagination properties from a single script execution.
+
+        The texts of the items and the pages, the current page, the "per page" value and the state
+        of the navigation buttons are read at once when entering the block. The "per page" value
+        is taken from the props of the Pagination component, or derived from the displayed items
+        and the current page. Only for a single displayed page with neither available it is looked
+        up in the options menu. The snapshot is not refreshed by any navigation done inside the
+        block.
+        """
+        snapshot = self.browser.execute_script(
+            PAGINATION_STATE,
+            self,
+            {
+                "items": self._items.locator,
+                "current_page": self._current_page.locator,
+                "total_pages": self._total_pages.locator,
+                "first": self._first.locator,
+                "previous": self._previous.locator,
+                "next": self._next.locator,
+                "last": self._last.locator,
+                "options": self._options.BUTTON_LOCATOR,
+            },
+            silent=True,
+        )
+        previous_snapshot = self._snapshot
+        self._snapshot = snapshot
+        try:
+            yield
+        finally:
+            self._snapshot = previous_snapshot
+
+    def state(self):
+        """Returns an immutable :py:class:`PaginationState` read by a single script execution."""
+        with self.snapshot():
+            first_item, last_item = self.displayed_items
+            return PaginationState(
+                first_item=first_item,
+                last_item=last_item,
+                total_items=self.total_items,
+                current_page=self.current_page,
+                total_pages=self.total_pages,
+                per_page=self.current_per_page,
+                is_first_enabled=not self.is_first_disabled,
+                is_previous_enabled=not self.is_previous_disabled,
+                is_next_enabled=not self.is_next_disabled,
+                is_last_enabled=not self.is_last_disabled,
+            )
+
+    def _button_disabled(self, name, widget):
+        button = self._from_snapshot(name)
+        if button is not None:
+            return not button["enabled"]
+        return not self.browser.element(widget).is_enabled()
+
     @property
     def is_enabled(self):
         """Overriding is_enabled property.
 
         Returns ``True`` when pagination dropdown button is enabled along with next & last button.
         """
+        options, next_button, last = (self._from_snapshot(k) for k in ("options", "next", "last"))
+        if None not in (options, next_button, last):
+            return (
+                options["enabled"]
+                and next_button["enabled"]
+                and (last["enabled"] if last["displayed"] else True)
+            )
         el = self.browser.element(self._last)
         last_flag = el.is_enabled() if el.is_displayed() else True
         return (
@@ -59,7 +211,7 @@ class BasePagination:
     @property
     def is_first_disabled(self):
         """Returns boolean detailing if the first page button is disabled."""
-        return not self.browser.element(self._first).is_enabled()
+        return self._button_disabled("first", self._first)
 
     def first_page(self):
         """Clicks on the first page button."""
@@ -70,7 +222,7 @@ class BasePagination:
     @property
     def is_previous_disabled(self):
         """Returns boolean detailing if the previous page button is disabled."""
-        return not self.browser.element(self._previous).is_enabled()
+        return self._button_disabled("previous", self._previous)
 
     def previous_page(self):
         """Clicks the previous page button."""
@@ -81,7 +233,7 @@ class BasePagination:
     @property
     def is_next_disabled(self):
         """Returns boolean detailing if the next page button is disabled."""
-        return not self.browser.element(self._next).is_enabled()
+        return self._button_disabled("next", self._next)
 
     def next_page(self):
         """Clicks the next page button."""
@@ -92,7 +244,7 @@ class BasePagination:
     @property
     def is_last_disabled(self):
         """Returns boolean detailing if the last page button is disabled."""
-        return not self.browser.element(self._last).is_enabled()
+        return self._button_disabled("last", self._last)
 
     def last_page(self):
         """Clicks the last page button."""
@@ -103,12 +255,25 @@ class BasePagination:
     @property
     def current_page(self):
         """Returns an int of the current page number."""
+        current_page = self._from_snapshot("current_page")
+        if current_page is not None:
+            return int(current_page)
         return int(self._current_page.value)
 
     @property
     def total_pages(self):
         """Returns int detailing the total number of pages."""
-        return int(self._total_pages.text.strip().split()[1])
+        total_pages = self._from_snapshot("total_pages")
+        if total_pages is None:
+            total_pages = self._total_pages.text
+        return int(total_pages.strip().split()[1])
+
+    @property
+    def _items_text(self):
+        items_string = self._from_snapshot("items")
+        if items_string is None:
+            items_string = self._items.text
+        return items_string
 
     @property
     def displayed_items(self):
@@ -116,14 +281,14 @@ class BasePagination:
 
         example "1 - 20 of 523 items"
         """
-        items_string = self._items.text
+        items_string = self._items_text
         first_num, last_num = items_string.split("of")[0].split("-")
         return int(first_num.strip()), int(last_num.strip())
 
     @property
     def total_items(self):
         """Returns a string detailing the number of displayed items"""
-        items_string = self._items.text
+        items_string = self._items_text
         return int(items_string.split("of")[1].split()[0])
 
     @property
@@ -131,6 +296,11 @@ class BasePagination:
         """Returns an iterable of the available pagination options."""
         return self._options.items
 
+    @property
+    def largest_per_page(self):
+        """Returns the largest number of items per page that can be set."""
+        return max(int(option.split()[0]) for option in self.per_page_options)
+
     @property
     def no_items(self):
         """Returns wether the pagination object has elements or not"""
@@ -142,6 +312,10 @@ class BasePagination:
         if self.cached_per_page_value:
             return self.cached_per_page_value
 
+        per_page = self._from_snapshot("per_page")
+        if per_page is not None:
+            return per_page
+
         if self.no_items:
             return 0
         else:
@@ -156,10 +330,13 @@ class BasePagination:
         assume that the "per page" setting is not going to change and it's not necessary to
         re-read it from the browser repeatedly.
         """
+        previous_value = self.cached_per_page_value
         self.cached_per_page_value = None
         self.cached_per_page_value = self.current_per_page
-        yield
-        self.cached_per_page_value = None
+        try:
+            yield
+        finally:
+            self.cached_per_page_value = previous_value
 
     def set_per_page(self, count):
         """Sets the number of items per page. (Will cast to str)"""
@@ -180,14 +357,124 @@ class BasePagination:
         self._current_page.fill(value)
         self.browser.send_keys(Keys.RETURN, self._current_page)
 
+    def _wait_for_page_change(self, displayed_items, timeout=10):
+        """Waits until the displayed items differ from the given ones."""
+        wait_for(
+            lambda: self.displayed_items != displayed_items,
+            timeout=timeout,
+            delay=0.2,
+            message="wait for the page to change",
+        )
+
+    def _ensure_per_page(self, count, timeout=10):
+        """Sets the number of items per page, if needed, and waits until it is applied."""
+        if self.current_per_page != count:
+            self.set_per_page(count)
+            wait_for(
+                lambda: self.current_per_page == count,
+                timeout=timeout,
+                delay=0.2,
+                message="wait for the per page value to change",
+            )
+
+    def iter_table_rows(self, table, columns=None, timeout=10):
+        """Yields the rows of the paginated table across all the pages as tuples.
+
+        The number of items per page is bumped to the largest option first. Every page is read by
+        a single :py:meth:`BasePatternflyTable.iter_rows` script, then the next page is requested
+        before the rows are handed out, so the browser loads it while the caller processes them.
+        Only one page of rows is kept in memory at a time.
+
+        Args:
+            table: The table widget controlled by this pagination.
+            columns: Names or positions of the columns to read, all columns if not specified.
+            timeout: How long to wait for every page change.
+        """
+        if self.no_items:
+            return
+        self._ensure_per_page(self.largest_per_page, timeout=timeout)
+        if self.current_page > 1:
+            displayed_items = self.displayed_items
+            self.first_page()
+            self._wait_for_page_change(displayed_items, timeout=timeout)
+
+        total_pages = self.total_pages
+        for page in range(1, total_pages + 1):
+            rows = self._page_rows(table, columns)
+            if page < total_pages:
+                displayed_items = self.displayed_items
+                self.next_page()
+            yield from rows
+            if page < total_pages:
+                self._wait_for_page_change(displayed_items, timeout=timeout)
+
+    def _page_rows(self, table, columns=None):
+        """Reads the rows of the table on the current page as tuples."""
+        if columns is None:
+            return [tuple(row.values()) for row in table.iter_rows()]
+        keys = [table.headers[table.map_column(column)] or column for column in columns]
+        return [tuple(row[key] for key in keys) for row in table.iter_rows(columns)]
+
+    def _navigate(self, page, current_page=None):
+        """Moves to the page with the cheapest transition available."""
+        if current_page is None:
+            current_page = self.current_page
+        if page == current_page:
+            return
+        elif page == current_page + 1:
+            self.next_page()
+        elif page == current_page - 1:
+            self.previous_page()
+        elif page == 1:
+            self.first_page()
+        else:
+            self.go_to_page(page)
+
+    def __getitem__(self, page):
+        """Navigates to the page number, negative numbers count from the last page.
+
+        Returns:
+            The number of the page navigated to.
+        """
+        if not isinstance(page, int):
+            raise TypeError("pagination[] accepts only integers")
+        total_pages = self.total_pages
+        if page < 0:
+            page += total_pages + 1
+        if not 1 <= page <= total_pages:
+            raise IndexError(f"Page {page} is out of range, there are {total_pages} pages")
+        self._navigate(page)
+        return page
+
+    def iter_pages(self, start=None, stop=None, step=1):
+        """Navigates through the pages like ``range(start, stop, step)`` and yields their numbers.
+
+        When the pagination has a page input, every transition is a single jump regardless of the
+        step. ``start`` and ``stop`` default to the first page and the page after the last one,
+        or the other way round for a negative step.
+        """
+        total_pages = self.total_pages
+        if start is None:
+            start = 1 if step > 0 else total_pages
+        if stop is None:
+            stop = total_pages + 1 if step > 0 else 0
+        current_page = self.current_page
+        for page in range(start, stop, step):
+            if not 1 <= page <= total_pages:
+                break
+            self._navigate(page, current_page)
+            current_page = page
+            yield page
+
     def __iter__(self):
         if self.current_page > 1:
             self.first_page()
         self._page_counter = 0
+        self._total_pages_count = self.total_pages
         return self
 
     def __next__(self):
-        if self._page_counter < self.total_pages:
+        if self._page_counter < self._total_pages_count:
             self._page_counter += 1
             if self._page_counter > 1:
                 self.next_page()
@@ -213,8 +500,9 @@ class BaseCompactPagination:
         return self.is_previous_disabled
 
     def first_page(self):
-        while not self.is_previous_disabled:
-            self.previous_page()
+        """Compact paginator has no "first" button, see :py:meth:`go_to_page`."""
+        if not self.no_items:
+            self.go_to_page(1)
 
     @property
     def is_last_disabled(self):
@@ -222,9 +510,45 @@ class BaseCompactPagination:
         return self.is_next_disabled
 
     def last_page(self):
-        """Compact paginator has no "last" button, so iterates until last is reached."""
-        while not self.is_next_disabled:
-            self.next_page()
+        """Compact paginator has no "last" button, see :py:meth:`go_to_page`."""
+        if not self.no_items:
+            self.go_to_page(self.total_pages)
+
+    def _step_to(self, page):
+        """Clicks the previous or next button until the page is reached."""
+        with self.cache_per_page_value():
+            current_page = self.current_page
+            # clicks may get lost while a page loads, so check where we got and try again
+            for _ in range(3):
+                if current_page == page:
+                    return
+                button = self._next if page > current_page else self._previous
+                for _ in range(abs(page - current_page)):
+                    button.click()
+                current_page = self.current_page
+        if current_page != page:
+            raise PaginationNavDisabled(f"page {page}")
+
+    def go_to_page(self, value):
+        """Compact paginator has no page input, so it clicks through the pages.
+
+        Changing the "per page" value keeps the page number unless the new page count is lower,
+        in which case the page is lowered to the last one. When moving backwards, the number of
+        clicks is therefore reduced by temporarily switching to the largest "per page" value.
+        """
+        page = int(value)
+        if not 1 <= page <= self.total_pages:
+            raise PaginationNavDisabled(f"page {page}")
+        current_page = self.current_page
+        per_page = self.current_per_page
+        largest = self.largest_per_page
+        if page < current_page and largest > per_page:
+            largest_total_pages = math.ceil(self.total_items / largest)
+            if page <= largest_total_pages < current_page:
+                self.set_per_page(largest)
+                self._step_to(page)
+                self.set_per_page(per_page)
+        self._step_to(page)
 
     @property
     def current_page(self):
@@ -263,3 +587,95 @@ class CompactPagination(BaseCompactPagination, Pagination):
     DEFAULT_LOCATOR = (
         ".//div[contains(@class, 'pf-c-pagination') and contains(@class, 'pf-m-compact')]"
     )
+
+
+def _read_shard(view, pagination, table, pages, per_page, columns, timeout):
+    pagination = getattr(view, pagination)
+    table = getattr(view, table)
+    pagination._ensure_per_page(per_page, timeout=timeout)
+    rows = []
+    current_page = pagination.current_page
+    for page in pages:
+        if page != current_page:
+            displayed_items = pagination.displayed_items
+            pagination._navigate(page, current_page)
+            pagination._wait_for_page_change(displayed_items, timeout=timeout)
+            current_page = page
+        rows.extend(pagination._page_rows(table, columns))
+    return rows
+
+
+def read_table_sharded(
+    view,
+    browser_factory,
+    view_factory,
+    sessions=2,
+    pagination="pagination",
+    table="table",
+    columns=None,
+    timeout=10,
+):
+    """Reads all the pages of a paginated table using several browser sessions in parallel.
+
+    The pages are split into contiguous shards, one per session. The first shard is read by the
+    ``view`` itself, every other one by a view created by ``view_factory`` in a session created by
+    ``browser_factory``, each on its own thread. Every shard jumps to its first page and reads the
+    pages like :py:meth:`BasePagination.iter_table_rows` does, with the largest "per page" value,
+    waiting for every page change. The extra sessions are quit when their shard has been read.
+
+    Args:
+        view: The view holding the pagination and the table.
+        browser_factory: A callable returning a new :py:class:`widgetastic.browser.Browser`
+            already displaying the page of the view.
+        view_factory: A callable returning the equivalent of ``view`` for a browser, e.g. by
+            walking down from a top level view.
+        sessions: The maximum number of sessions to read the pages with, ``view``'s included.
+        pagination: Name of the pagination widget in the view.
+        table: Name of the table widget in the view.
+        columns: Names or positions of the columns to read, all columns if not specified.
+        timeout: How long to wait for the "per page" value and every page to change.
+
+    Returns:
+        A tuple of the list of rows as tuples, in the page order, and the list of
+        :py:class:`ShardTiming` of every shard.
+    """
+    main_pagination = getattr(view, pagination)
+    if main_pagination.no_items:
+        return [], []
+    per_page = main_pagination.largest_per_page
+    main_pagination._ensure_per_page(per_page, timeout=timeout)
+    total_pages = main_pagination.total_pages
+    shard_size = math.ceil(total_pages / sessions)
+    shards = [
+        range(start, min(start + shard_size, total_pages + 1))
+        for start in range(1, total_pages + 1, shard_size)
+    ]
+
+    def read(shard):
+        started = time.monotonic()
+        pages = shards[shard]
+        if shard == 0:
+            rows = _read_shard(view, pagination, table, pages, per_page, columns, timeout)
+        else:
+            browser = browser_factory()
+            try:
+                shard_view = view_factory(browser)
+                rows = _read_shard(shard_view, pagination, table, pages, per_page, columns, timeout)
+            finally:
+                browser.selenium.quit()
+        return rows, ShardTiming(shard, pages, len(rows), time.monotonic() - started)
+
+    with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+        results = list(executor.map(read, range(len(shards))))
+    rows = [row for shard_rows, _ in results for row in shard_rows]
+    timings = [timing for _, timing in results]
+    for timing in timings:
+        view.logger.info(
+            "Shard %d read %d rows of pages %d-%d in %.2fs",
+            timing.shard,
+            timing.rows,
+            timing.pages.start,
+            timing.pages.stop - 1,
+            timing.seconds,
+        )
+    return rows, timings
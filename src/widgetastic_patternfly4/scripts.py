@@ -0,0 +1,120 @@
+from wait_for import TimedOutError
+
+# find() and findAll() evaluate an XPath relative to the context node, text() is the same as
+# normalize-space(.) of XPath and visibleText() is the rendered text as the browser wrapper reads it
+DOM_FUNCTIONS = """
+    function find(expr, context) {
+        return document.evaluate(
+            expr, context, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    function findAll(expr, context) {
+        var result = document.evaluate(
+            expr, context, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) {
+            nodes.push(result.snapshotItem(i));
+        }
+        return nodes;
+    }
+    function text(el) {
+        return (el.textContent || "").replace(/[ \\t\\r\\n]+/g, " ").trim();
+    }
+    function visibleText(el) {
+        return el.innerText || el.textContent || "";
+    }
+"""
+
+# fiberOf() returns the React fiber of a DOM node rendered by React, null if there is none. The
+# props of the components up the tree are in memoizedProps while walking the fiber.return chain.
+REACT_FUNCTIONS = """
+    function fiberOf(el) {
+        var key = Object.keys(el).find(function(name) {
+            return name.startsWith("__reactFiber$") || name.startsWith("__reactInternalInstance$");
+        });
+        return key ? el[key] : null;
+    }
+"""
+
+# changeToken() returns a token that stays the same until a MutationObserver sees the node change.
+# The observer is installed with the first call and kept on the node under name. options are those
+# of MutationObserver.observe, the whole subtree by default, and filter picks the mutation records
+# that count as a change, all of them by default.
+CHANGE_FUNCTIONS = """
+    function changeToken(node, name, options, filter) {
+        var state = node[name];
+        if (!state) {
+            state = node[name] = {id: Math.random().toString(36).slice(2), changes: 0};
+            state.count = function(records) {
+                state.changes += filter ? records.filter(filter).length : records.length;
+            };
+            state.observer = new MutationObserver(state.count);
+            state.observer.observe(node, options || {
+                subtree: true, childList: true, attributes: true, characterData: true});
+        }
+        state.count(state.observer.takeRecords());
+        return state.id + ":" + state.changes;
+    }
+"""
+
+OUIA_SAFE = (
+    CHANGE_FUNCTIONS
+    + """
+    var element = arguments[0], token = arguments[1];
+    var key = changeToken(
+        element, "__wtOuiaSafe", {attributes: true, attributeFilter: ["data-ouia-safe"]});
+    if (key === token) {
+        return null;
+    }
+    return {token: key, safe: element.getAttribute("data-ouia-safe")};
+"""
+)
+
+WAIT_OUIA_SAFE = """
+    var element = arguments[0], timeout = arguments[1];
+    function safe() {
+        return element.getAttribute("data-ouia-safe") === "true";
+    }
+    if (safe()) {
+        return true;
+    }
+    return new Promise(function(done) {
+        var timer, observer = new MutationObserver(function() {
+            if (safe()) {
+                finish(true);
+            }
+        });
+        function finish(result) {
+            observer.disconnect();
+            clearTimeout(timer);
+            done(result);
+        }
+        observer.observe(element, {attributes: true, attributeFilter: ["data-ouia-safe"]});
+        timer = setTimeout(function() { finish(safe()); }, timeout);
+    });
+"""
+
+
+def ouia_safe_state(widget):
+    """Returns the value of the ``data-ouia-safe`` attribute of the widget.
+
+    The value is remembered until a MutationObserver sees the attribute flip or the element gets
+    replaced, e.g. by a page navigation. Until then the script does not read the attribute again.
+    None is returned if the attribute is missing.
+    """
+    result = widget.browser.execute_script(
+        OUIA_SAFE, widget, getattr(widget, "_ouia_safe_token", None), silent=True
+    )
+    if result is not None:
+        widget._ouia_safe_token = result["token"]
+        widget._ouia_safe = result["safe"]
+    return widget._ouia_safe
+
+
+def wait_for_ouia_safe(widget, timeout=10):
+    """Waits in the page until ``data-ouia-safe`` of the widget is ``true``, in one script.
+
+    Raises:
+        TimedOutError: if the widget did not become safe in time.
+    """
+    if not widget.browser.execute_script(WAIT_OUIA_SAFE, widget, timeout * 1000, silent=True):
+        raise TimedOutError(f"{widget!r} did not become OUIA safe in {timeout} seconds")
@@ -3,6 +3,8 @@ from widgetastic.exceptions import NoSuchElementException
 from .dropdown import Dropdown
 from .dropdown import DropdownItemDisabled
 from .dropdown import DropdownItemNotFound
+from .dropdown import fill_checkboxes
+from .dropdown import read_checkboxes
 
 
 class SelectItemDisabled(DropdownItemDisabled):
@@ -30,6 +32,9 @@ class BaseSelect:
     TEXT_LOCATOR = (
         ".//div[contains(@class, 'pf-c-select') and child::button[normalize-space(.)={}]]"
     )
+    TYPEAHEAD_LOCATOR = ".//input[contains(@class, 'pf-c-select__toggle-typeahead')]"
+    # above this number of options a typeahead select filters the menu before selecting
+    TYPEAHEAD_THRESHOLD = 100
 
     def item_element(self, item, close=True):
         """Returns a WebElement for given item name."""
@@ -42,24 +47,67 @@ class BaseSelect:
                 )
             )
 
-    def item_select(self, item):
+    def _disabled_item_error(self, item):
+        return SelectItemDisabled(
+            'Item "{}" of {} is disabled\n'
+            "The following items are available and enabled: {}".format(
+                item, repr(self), [entry.text for entry in self._read_items() if entry.enabled]
+            )
+        )
+
+    @property
+    def has_typeahead(self):
+        """Returns whether the Select has a typeahead input."""
+        return bool(self.browser.elements(self.TYPEAHEAD_LOCATOR))
+
+    def item_select(self, item, use_typeahead=None):
         """Opens the Select and selects the desired item.
 
         Args:
             item: Item to be selected
+            use_typeahead: Whether to type the item into the typeahead input and select it from
+                the filtered menu. By default it is used when the Select has a typeahead input and
+                had more than ``TYPEAHEAD_THRESHOLD`` options the last time it was open.
 
         Raises:
             SelectItemDisabled: if item is disabled
         """
+        if use_typeahead is None:
+            use_typeahead = self._option_count > self.TYPEAHEAD_THRESHOLD and self.has_typeahead
+        if use_typeahead:
+            return self._typeahead_select(item)
+        return super().item_select(item)
+
+    def _typeahead_select(self, item, timeout=3):
+        """Types the item into the typeahead input and selects it from the filtered menu.
+
+        If the item could not be selected, the typed filter is cleared again before closing.
+        After a selection the Select shows the selected item in the input itself.
+        """
+        self.logger.info("Selecting %r using the typeahead input", item)
+        selected = False
         try:
-            return super().item_select(item)
-        except DropdownItemDisabled:
-            raise SelectItemDisabled(
-                'Item "{}" of {} is disabled\n'
-                "The following items are available and enabled: {}".format(
-                    item, repr(self), self.enabled_items
+            self.browser.clear(self.TYPEAHEAD_LOCATOR)
+            self.browser.send_keys(item, self.TYPEAHEAD_LOCATOR)
+            # the filtering may happen on the server side, so wait for the item to show up
+            located = self._locate_item(item, timeout=timeout, toggle=False)
+            if located is None:
+                raise SelectItemNotFound(
+                    "Item {!r} not found in {}. Available items: {}".format(
+                        item, repr(self), [entry.text for entry in self._read_items()]
+                    )
                 )
-            )
+            if located["disabled"]:
+                raise self._disabled_item_error(item)
+            self.browser.click(located["element"])
+            selected = True
+        finally:
+            if not selected:
+                try:
+                    self.browser.clear(self.TYPEAHEAD_LOCATOR)
+                except NoSuchElementException:
+                    pass
+            self.close(ignore_nonpresent=True)
 
     def fill(self, value):
         """Fills a Select with a value."""
@@ -82,6 +130,10 @@ class BaseCheckboxSelect(BaseSelect):
 
     ITEMS_LOCATOR = ".//label[contains(@class, 'pf-c-select__menu-item')]"
     ITEM_LOCATOR = f"{ITEMS_LOCATOR}/span[starts-with(normalize-space(.), {{}})]/preceding-sibling::input"  # noqa
+    ITEM_CHECKBOX_LOCATOR = ".//input"
+    # how fill_checkboxes matches the items, the same way as ITEM_LOCATOR
+    ITEM_LABEL_LOCATOR = "./span"
+    ITEM_PREFIX_MATCH = True
 
     def item_select(self, items, close=True):
         """Opens the Checkbox and selects the desired item.
@@ -125,33 +177,38 @@ class BaseCheckboxSelect(BaseSelect):
         """Fills a Checkbox with all items.
         Example dictionary: {"foo": True, "bar": False, "baz": True}
 
+        Only the checkboxes whose state differs are clicked, all in a single script.
+
         Args:
             items: A dictionary containing what items to select (True) or deselect (False)
+
+        Returns:
+            Boolean - True if any checkbox changed, False if not.
+
+        Raises:
+            SelectItemNotFound: if any of the items is missing
+            SelectItemDisabled: if any of the items is disabled or could not be changed
         """
         try:
-            for item, value in items.items():
-                if value:
-                    self.item_select(item, close=False)
-                else:
-                    self.item_deselect(item, close=False)
+            self.open()
+            return fill_checkboxes(
+                self, items, not_found=SelectItemNotFound, disabled=SelectItemDisabled
+            )
         finally:
             self.close()
 
-    def read(self):
-        """Returns a dictionary containing the selected status as bools."""
-        selected = {}
+    @property
+    def checkbox_states(self):
+        """Returns the labels and checked states of all items as :py:class:`CheckboxStates`.
+
+        Unlike :py:meth:`read` it does not build a dictionary, which suits frequent polling.
+        """
         with self.opened():
-            for el in self.browser.elements(self.ITEMS_LOCATOR):
-                item = self.browser.text(el)
-                try:
-                    # get the child element of the label
-                    selected[item] = self.browser.element(
-                        parent=el, locator="./input"
-                    ).is_selected()
-                except NoSuchElementException:
-                    selected[item] = False
+            return read_checkboxes(self)
 
-        return selected
+    def read(self):
+        """Returns a dictionary containing the selected status as bools."""
+        return self.checkbox_states.as_dict()
 
     def _get_items(self, close=False):
         """Returns a list of all checkbox items as strings.
@@ -160,7 +217,7 @@ class BaseCheckboxSelect(BaseSelect):
             close: Close the dropdown when finished
         """
         self.open()
-        result = [self.browser.text(el) for el in self.browser.elements(self.ITEMS_LOCATOR)]
+        result = [item.text for item in self._read_items()]
 
         if close:
             self.close()
@@ -1,3 +1,5 @@
+from contextlib import contextmanager
+
 from selenium.common.exceptions import NoSuchElementException
 from widgetastic.log import create_item_logger
 from widgetastic.widget import Table
@@ -7,6 +9,71 @@ from widgetastic.widget import Text
 from widgetastic.widget import Widget
 from widgetastic.widget.table import resolve_table_widget
 
+from .scripts import CHANGE_FUNCTIONS
+from .scripts import DOM_FUNCTIONS
+
+BULK_READ_TABLE = (
+    DOM_FUNCTIONS
+    + """
+    var table = arguments[0], headers = arguments[1], rows = arguments[2], cells = arguments[3],
+        headerInRow = arguments[4], headerPosition = arguments[5], spans = arguments[6],
+        columns = arguments[7];
+    if (findAll(spans, table).length) {
+        // rowspan/colspan layouts are resolved by widgetastic's table tree
+        return null;
+    }
+    return {
+        headers: findAll(headers, table).map(visibleText),
+        rows: findAll(rows, table).map(function(row) {
+            // the same column positions as the <th> adjustment of the row's __getitem__
+            var found = findAll(cells, row), header = findAll(headerInRow, row);
+            if (header.length) {
+                found.splice(headerPosition, 0, header[0]);
+            }
+            if (columns === null) {
+                return found.map(visibleText);
+            }
+            return columns.map(function(position) {
+                return position < found.length ? visibleText(found[position]) : null;
+            });
+        }),
+    };
+"""
+)
+
+TABLE_LAYOUT = (
+    DOM_FUNCTIONS
+    + CHANGE_FUNCTIONS
+    + """
+    var table = arguments[0], token = arguments[1], headers = arguments[2], rows = arguments[3],
+        rowHeader = arguments[4];
+    function changesLayout(mutation) {
+        var el = mutation.target.nodeType === 1 ? mutation.target : mutation.target.parentElement;
+        if (!el || el.closest("table") !== table) {
+            return false;
+        }
+        if (el.closest("thead")) {
+            // header texts or header cells changed
+            return true;
+        }
+        // the set of rows or cells changed
+        return mutation.type === "childList" && /^(TABLE|TBODY|TR)$/.test(el.tagName);
+    }
+    var key = changeToken(
+        table, "__wtLayout", {childList: true, characterData: true, subtree: true}, changesLayout);
+    if (key === token) {
+        return null;
+    }
+    return {
+        token: key,
+        headers: findAll(headers, table).map(visibleText),
+        rowHeaders: findAll(rows, table).map(function(row) {
+            return findAll(rowHeader, row).length > 0;
+        }),
+    };
+"""
+)
+
 
 class HeaderColumn(TableColumn):
     """Represents a cell in the header row."""
@@ -68,11 +135,25 @@ class PatternflyTableRow(TableRow):
     """
 
     HEADER_IN_ROW = "./th[1]"
+    # The <td> cells of the row and the column position __getitem__ gives to the <th> in the row,
+    # used by the bulk reads
+    DATA_CELLS = "./td"
+    ROW_HEADER_POSITION = 1
     TABLE_COLUMN_CLS = TableColumn
 
     @property
     def has_row_header(self):
-        """Returns a boolean detailing if the Table Row has a header."""
+        """Returns a boolean detailing if the Table Row has a header.
+
+        Within a row or table read the layout checked at its start is used without a script.
+        """
+        table = self.table
+        if table._layout_scopes and table._layout is not None:
+            layout = table._layout
+        else:
+            layout = table.refresh_layout()
+        if self.index < len(layout["row_headers"]):
+            return layout["row_headers"][self.index]
         return len(self.browser.elements(self.HEADER_IN_ROW)) > 0
 
     def __getitem__(self, item):
@@ -97,6 +178,19 @@ class PatternflyTableRow(TableRow):
         # After adjusting the index, call the original __getitem__ to get our TableColumn item
         return super().__getitem__(index)
 
+    def read(self):
+        """Reads the row, served from the cell texts prefetched by a bulk read of the table."""
+        plan = self.table._read_plan
+        with self.table._layout_checked():
+            if plan is None:
+                return super().read()
+            return self.table._planned_read(self, plan)
+
+    @staticmethod
+    def _process_read(result):
+        """Post-processes the dictionary produced by reading the row."""
+        return result
+
 
 class BasePatternflyTable:
     """Represents the Patternfly table.
@@ -106,11 +200,19 @@ class BasePatternflyTable:
 
     ROWS = "./tbody/tr[./td]"
     HEADERS = "./thead/tr/th|./tr/th|./thead/tr/td"
+    # Set to True to make read() use bulk_read()
+    BULK_READ = False
 
     Row = PatternflyTableRow
 
     header_row = HeaderRow()
 
+    _layout = None
+    # number of the reads in progress that checked the layout at their start
+    _layout_scopes = 0
+    # (headers, column positions, cell texts per row or None) of the bulk read in progress
+    _read_plan = None
+
     @property
     def _is_header_in_body(self):
         """Override this to return False.
@@ -120,6 +222,64 @@ class BasePatternflyTable:
         """
         return False
 
+    def refresh_layout(self):
+        """Returns the layout of the table, re-discovering it only when it has changed.
+
+        The layout holds the headers and the "has ``<th>``" flag of every row. A MutationObserver
+        installed on the table counts changes of the ``<thead>`` and of the set of rows and cells,
+        so checking whether the cached layout is still current costs a single script execution.
+        The cached properties derived from the headers are dropped when the layout changes.
+
+        The layout is checked once at the start of a row or table read, for a ``<th>`` lookup of
+        a row outside of reads and when the headers are not known yet. :py:meth:`clear_cache`
+        invalidates it explicitly.
+        """
+        data = self.browser.execute_script(
+            TABLE_LAYOUT,
+            self,
+            self._layout and self._layout["token"],
+            self.HEADERS,
+            self.ROWS,
+            self.Row.HEADER_IN_ROW,
+            silent=True,
+        )
+        if data is not None:
+            self.clear_cache()
+            headers = tuple(header.strip() or None for header in data["headers"])
+            without_none = [x for x in headers if x is not None]
+            if len(without_none) != len(set(without_none)):
+                self.logger.warning(
+                    "Detected duplicate headers in %r. Correct functionality is not guaranteed",
+                    without_none,
+                )
+            self._layout = {
+                "token": data["token"],
+                "headers": headers,
+                "row_headers": data["rowHeaders"],
+            }
+        return self._layout
+
+    @contextmanager
+    def _layout_checked(self):
+        """Checks the layout once, the ``<th>`` lookups of the rows use it within the block."""
+        if not self._layout_scopes:
+            self.refresh_layout()
+        self._layout_scopes += 1
+        try:
+            yield
+        finally:
+            self._layout_scopes -= 1
+
+    def clear_cache(self):
+        """Clear all cached properties, the cached layout included."""
+        super().clear_cache()
+        self._layout = None
+
+    @property
+    def headers(self):
+        layout = self._layout or self.refresh_layout()
+        return layout["headers"]
+
     def sort_by(self, column, order):
         """Sets the sort order for the supplied column by name, and "ascending/descending"."""
         header = self.header_row[column]
@@ -137,6 +297,150 @@ class BasePatternflyTable:
         """Deselects all the rows."""
         self._toggle_select_all(False, column)
 
+    def _widget_columns(self, headers):
+        """Returns the positions of the columns that have a widget in ``column_widgets``.
+
+        The lookup mirrors ``TableColumn.widget``, named columns are looked up by their name and
+        the unnamed ones by their position.
+        """
+        header_index = {header: index for index, header in enumerate(headers) if header}
+        result = set()
+        for index, header in enumerate(headers):
+            key = header if header_index.get(header) == index else index
+            if key in self.column_widgets:
+                result.add(index)
+        return result
+
+    def _row_positions(self, row_count):
+        """Returns the positions of the rows that are not ignored when reading."""
+        positions = range(row_count)
+        if self.rows_ignore_top is not None:
+            positions = positions[self.rows_ignore_top :]
+        if self.rows_ignore_bottom is not None and self.rows_ignore_bottom > 0:
+            positions = positions[: -self.rows_ignore_bottom]
+        return positions
+
+    def _column_positions(self, columns):
+        """Maps the column names or positions to positions, the ``assoc_column`` included."""
+        positions = [self.map_column(column) for column in columns]
+        if self.assoc_column_position is not None and self.assoc_column_position not in positions:
+            positions.append(self.assoc_column_position)
+        return positions
+
+    def _plan(self, columns=None):
+        """Pulls the texts of the cells to read with a single script execution.
+
+        Returns:
+            ``(headers, positions, cells)``, ``cells`` holds the texts of the read columns of every
+            row, None for the cells read through the row widgets. It is None altogether if the
+            table has rowspan or colspan cells, then all the cells are read through the widgets.
+        """
+        positions = None if columns is None else self._column_positions(columns)
+        data = self.browser.execute_script(
+            BULK_READ_TABLE,
+            self,
+            self.HEADERS,
+            self.ROWS,
+            self.Row.DATA_CELLS,
+            self.Row.HEADER_IN_ROW,
+            self.Row.ROW_HEADER_POSITION,
+            "./tbody//td[@rowspan or @colspan]",
+            positions,
+            silent=True,
+        )
+        if data is None:
+            headers = self.headers
+            return headers, positions or range(len(headers)), None
+        headers = [header.strip() or None for header in data["headers"]]
+        if positions is None:
+            positions = range(len(headers))
+        widget_columns = self._widget_columns(headers)
+        cells = [
+            [
+                None if position in widget_columns or text is None else text.strip()
+                for position, text in zip(positions, row)
+            ]
+            for row in data["rows"]
+        ]
+        return headers, positions, cells
+
+    def _planned_read(self, row, plan):
+        """Reads the row like ``TableRow.read`` does, from the prefetched texts where possible."""
+        headers, positions, cells = plan
+        texts = cells[row.index] if cells is not None and row.index < len(cells) else []
+        result = {}
+        for i, position in enumerate(positions):
+            text = texts[i] if i < len(texts) else None
+            result[headers[position] or position] = row[position].read() if text is None else text
+        return result
+
+    def _all_rows(self):
+        plan = self._read_plan
+        if plan is None or plan[2] is None:
+            yield from super()._all_rows()
+            return
+        # the rows are known from the bulk read, no need to count them again
+        for row_pos in range(len(plan[2])):
+            yield self._create_row(self, row_pos, logger=create_item_logger(self.logger, row_pos))
+
+    @contextmanager
+    def _planned(self, columns=None):
+        self._read_plan = self._plan(columns)
+        try:
+            yield
+        finally:
+            self._read_plan = None
+
+    def iter_rows(self, columns=None):
+        """Yields the rows read as dictionaries, like :py:meth:`read` does for every row.
+
+        All the cell texts are pulled with a single script execution. The cells of a row are
+        mapped to the columns the same way the ``<th>``-in-row adjustment of the row's
+        ``__getitem__`` does it. Only columns with ``column_widgets`` (or cells missing in the row)
+        are read per cell through the row widgets. Tables with rowspan or colspan cells are read
+        through the row widgets.
+
+        Args:
+            columns: Names or positions of the columns to read, all columns if not specified.
+        """
+        plan = self._plan(columns)
+        rows = list(self) if plan[2] is None else None
+        row_count = len(rows) if rows is not None else len(plan[2])
+        for row_position in self._row_positions(row_count):
+            if rows is not None:
+                row = rows[row_position]
+            else:
+                row = self._create_row(
+                    self, row_position, logger=create_item_logger(self.logger, row_position)
+                )
+            # not held across the yield, the table may change in between
+            with self._layout_checked():
+                result = row._process_read(self._planned_read(row, plan))
+            yield result
+
+    def bulk_read(self, columns=None):
+        """Reads the table like :py:meth:`read` but with a single script execution.
+
+        See :py:meth:`iter_rows` for the details. The rows are read by ``Table.read`` with the
+        texts served from the prefetched cells.
+
+        Args:
+            columns: Names or positions of the columns to read, all columns if not specified.
+        """
+        with self._planned(columns), self._layout_checked():
+            return super().read()
+
+    def read(self, columns=None):
+        """Reads the table.
+
+        Passing ``columns`` reads only the given columns, see :py:meth:`bulk_read`, which is also
+        used for the whole table in the ``BULK_READ`` mode.
+        """
+        if columns is not None or self.BULK_READ:
+            return self.bulk_read(columns)
+        with self._layout_checked():
+            return super().read()
+
 
 class PatternflyTable(BasePatternflyTable, Table):
     pass
@@ -183,6 +487,7 @@ class ExpandableTableRow(PatternflyTableRow):
 
     # Override these values inherited from PatternflyTableRow...
     HEADER_IN_ROW = "./tr[1]/th[1]"
+    DATA_CELLS = "./tr[1]/td"
     TABLE_COLUMN_CLS = ExpandableTableHeaderColumn
 
     def __init__(self, parent, index, content_view=None, logger=None):
@@ -229,7 +534,10 @@ class ExpandableTableRow(PatternflyTableRow):
 
     def read(self):
         """Returns a text representation of the table row."""
-        result = super().read()
+        return self._process_read(super().read())
+
+    @staticmethod
+    def _process_read(result):
         # Remove the column with the "expand" button in it
         if 0 in result and not result[0]:
             del result[0]
@@ -380,6 +688,9 @@ class ExpandableColumn(TableColumn):
 class CompoundExpandableRow(PatternflyTableRow):
     TABLE_COLUMN_CLS = ExpandableColumn
     HEADER_IN_ROW = "./tr[1]/th[1]"
+    DATA_CELLS = "./tr[1]/td"
+    # Typically for this widget the layout is: <th>, <td>, <td>, <td>, and so on...
+    ROW_HEADER_POSITION = 0
     # these are the columns that allow for expansion
     EXPANDABLE_COLUMNS = "./tr[1]/td[contains(@class, 'compound-expansion')]"
     Column = ExpandableColumn
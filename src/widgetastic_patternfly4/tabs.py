@@ -1,7 +1,10 @@
+from wait_for import TimedOutError
 from wait_for import wait_for_decorator
 from widgetastic.utils import ParametrizedLocator
 from widgetastic.widget import View
 
+from .dropdown import click_and_wait_for_class
+
 
 class Tab(View):
     """Represents the Patternfly Tab widget.
@@ -15,6 +18,9 @@ class Tab(View):
     # The text on the tab. Can be omitted if it is the same as the tab class name capitalized
     TAB_NAME = None
 
+    # wait for the tab to become active with a MutationObserver instead of polling
+    EVENT_DRIVEN_WAIT = False
+
     # Locator of the Tab selector
     TAB_LOCATOR = ParametrizedLocator(
         './/div[contains(@class, "pf-c-tabs")]/ul'
@@ -51,6 +57,12 @@ class Tab(View):
         """Selects the tab (checks if active already first)."""
         if not self.is_active():
             self.logger.info("Opening the tab %s", self.tab_name)
+            if self.EVENT_DRIVEN_WAIT:
+                if not click_and_wait_for_class(
+                    self.parent_browser, self.TAB_LOCATOR, "pf-m-current", click_locator="./button"
+                ):
+                    raise TimedOutError("{!r} was not selected in 3 seconds".format(self))
+                return
 
             @wait_for_decorator(timeout=3)
             def _click():
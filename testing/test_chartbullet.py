@@ -94,3 +94,21 @@ def test_bullet_chart(chart_data):
     assert warning_legend.color == "rgb(236, 122, 8)"
     # get legend with wrong label
     assert not chart.get_legend("foo")
+
+
+def test_bullet_chart_hover_free(chart_data, monkeypatch):
+    chart, bar_data, _, _ = chart_data
+    assert chart.data == bar_data
+    # the tooltip fallback reads the same data points
+    monkeypatch.setattr(BulletChart, "HOVER_FREE", False)
+    assert chart.data == bar_data
+
+
+def test_bullet_chart_legend_snapshot(chart_data):
+    chart, _, legend_data, _ = chart_data
+    snapshot = chart.legend_snapshot
+    assert [(item.label, item.value) for item in snapshot] == [tuple(leg) for leg in legend_data]
+    assert [leg.color for leg in chart.legends] == [item.color for item in snapshot]
+    assert not any(item.hidden for item in snapshot)
+    # nothing re-rendered, the same snapshot is served again
+    assert chart.legend_snapshot is snapshot
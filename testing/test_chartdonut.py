@@ -1,4 +1,5 @@
 import pytest
+from wait_for import TimedOutError
 from widgetastic.widget import View
 
 from widgetastic_patternfly4 import DonutChart
@@ -23,3 +24,16 @@ def test_donut(donut_chart):
         {"label": "Birds", "value": "10"},
     ]
     assert donut_chart.legend.item("Cats").label == "Cats"
+
+
+def test_donut_read(donut_chart):
+    data = donut_chart.read()
+    assert data["labels"] == donut_chart.donut.labels
+    assert data["legend"] == [
+        {"label": "Cats", "value": 35},
+        {"label": "Dogs", "value": 55},
+        {"label": "Birds", "value": 10},
+    ]
+    # nothing changes on the static example
+    with pytest.raises(TimedOutError):
+        donut_chart.wait_for_change(data, timeout=1)
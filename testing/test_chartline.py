@@ -40,3 +40,12 @@ def test_line_chart(chart):
 
     # read graph
     assert chart.read() == TEST_DATA
+
+
+def test_line_chart_columnar(chart):
+    columns = chart.read(columnar=True)
+    assert columns.x_labels == list(TEST_DATA)
+    assert columns.series == {
+        name: [values[name] for values in TEST_DATA.values()]
+        for name in list(TEST_DATA.values())[0]
+    }
@@ -5,10 +5,42 @@ from widgetastic.widget import View
 from widgetastic_patternfly4 import CategoryChipGroup
 from widgetastic_patternfly4 import Chip
 from widgetastic_patternfly4 import ChipGroup
+from widgetastic_patternfly4 import ChipGroupToolbar
 from widgetastic_patternfly4 import ChipReadOnlyError
 
 TESTING_PAGE_URL = "https://patternfly-react.surge.sh/components/chip-group"
 
+CHIP_TOOLBAR = """
+    function chip(name) {
+        return "<li class='pf-c-chip-group__list-item'><div class='pf-c-chip'>"
+            + "<span class='pf-c-chip__text'>" + name + "</span>"
+            + "<button aria-label='close'>x</button></div></li>";
+    }
+    var div = document.createElement("div");
+    div.id = "wt-chip-toolbar";
+    div.innerHTML = "<ul class='pf-c-chip-group pf-m-toolbar'><li><ul class='pf-c-chip-group'>"
+        + "<li><span class='pf-c-chip-group__label'>Status</span></li>"
+        + chip("Active") + chip("Paused") + "</ul></li>"
+        + "<li><ul class='pf-c-chip-group'>"
+        + "<li><span class='pf-c-chip-group__label'>Region</span></li>"
+        + chip("Europe") + "<li><button class='pf-c-chip pf-m-overflow'>"
+        + "<span class='pf-c-chip__text'>1 more</span></button></li></ul></li></ul>";
+    div.addEventListener("click", function(event) {
+        var close = event.target.closest("button[aria-label='close']");
+        if (close) {
+            close.closest(".pf-c-chip-group__list-item").remove();
+            return;
+        }
+        var overflow = event.target.closest(".pf-m-overflow");
+        if (overflow && overflow.textContent === "1 more") {
+            // like the chip group, the collapsed chips are rendered only once expanded
+            overflow.parentNode.insertAdjacentHTML("beforebegin", chip("Asia"));
+            overflow.firstChild.textContent = "Show less";
+        }
+    });
+    document.body.appendChild(div);
+"""
+
 
 @pytest.fixture(scope="module")
 def chips_view(browser):
@@ -124,3 +156,52 @@ def test_chipgroup_category(category_chip_group_view):
     # This tests that a category disappears after all chips are removed
     category_chip_group_view.category_two.remove_all_chips()
     assert not category_chip_group_view.category_two.is_displayed
+
+
+def test_chipgroup_remove_chips(browser):
+    class TestView(View):
+        ROOT = ".//div[@id='ws-react-c-chip-group-chip-groups-with-categories']"
+        category_one = CategoryChipGroup(label="Category one")
+
+    group = TestView(browser).category_one
+    chips = group.read()
+    with pytest.raises(ValueError):
+        group.remove_chips([chips[0], "Non existing chip"])
+    # nothing is removed if any of the chips is missing
+    assert group.read() == chips
+    group.remove_chips(chips[:2])
+    assert group.read() == chips[2:]
+
+
+def test_chipgroup_read_chips(browser):
+    class TestView(View):
+        ROOT = ".//div[@id='ws-react-c-chip-group-chip-groups-with-categories']"
+        category_one = CategoryChipGroup(label="Category one")
+
+    group = TestView(browser).category_one
+    chips = group.read_chips()
+    assert list(chips) == ["Category one"]
+    assert [text for text, _ in chips["Category one"]] == group.read()
+    assert [(chip.text, chip.badge) for chip in group] == chips["Category one"]
+    assert "Category one" in CategoryChipGroup.all(browser)
+
+
+@pytest.fixture
+def chip_toolbar(browser):
+    # categories of the old toolbar markup, one collapsed behind a 'N more' overflow chip
+    browser.execute_script(CHIP_TOOLBAR)
+    # the parent of the toolbar, as the default TOOLBAR_LOCATOR
+    yield ChipGroupToolbar(browser, locator=".//div[@id='wt-chip-toolbar']")
+    browser.execute_script("document.getElementById('wt-chip-toolbar').remove();")
+
+
+def test_chipgroup_toolbar_read(chip_toolbar):
+    # every category once, with its own chips only
+    assert chip_toolbar.read() == {"Status": ["Active", "Paused"], "Region": ["Europe", "Asia"]}
+    assert chip_toolbar.has_chips
+
+
+def test_chipgroup_toolbar_remove_collapsed_chips(chip_toolbar):
+    # "Asia" is not rendered until the "Region" category is expanded
+    chip_toolbar.remove_chips(["Paused", "Asia"])
+    assert chip_toolbar.read() == {"Status": ["Active"], "Region": ["Europe"]}
@@ -76,6 +76,16 @@ def test_dropdown_items(dropdown):
     assert not dropdown.item_enabled("Disabled link")
 
 
+def test_dropdown_items_snapshot(dropdown):
+    snapshot = dropdown.items_snapshot
+    assert [item.text for item in snapshot] == dropdown.items
+    assert dropdown.enabled_items == [item.text for item in snapshot if item.enabled]
+    assert "Disabled link" not in dropdown.enabled_items
+    with dropdown.opened():
+        # served from the same snapshot while the dropdown stays open
+        assert dropdown._read_items() is dropdown._read_items()
+
+
 def test_dropdown_open(dropdown):
     assert not dropdown.is_open
     dropdown.open()
@@ -84,6 +94,14 @@ def test_dropdown_open(dropdown):
     assert not dropdown.is_open
 
 
+def test_dropdown_event_driven_wait(dropdown, monkeypatch):
+    monkeypatch.setattr(type(dropdown), "EVENT_DRIVEN_WAIT", True)
+    dropdown.open()
+    assert dropdown.is_open
+    dropdown.close()
+    assert not dropdown.is_open
+
+
 def test_dropdown_item_select(dropdown):
     dropdown.item_select("Action")
     assert not dropdown.is_open
@@ -93,6 +111,15 @@ def test_dropdown_item_select(dropdown):
         dropdown.item_select("Non existing items")
 
 
+def test_dropdown_item_select_opened(dropdown):
+    dropdown.open()
+    dropdown.item_select("Action")
+    assert not dropdown.is_open
+    with pytest.raises(DropdownItemDisabled, match="Disabled action"):
+        dropdown.item_select("Disabled link")
+    assert not dropdown.is_open
+
+
 def test_group_dropdown(group_dropdown):
     assert group_dropdown.is_displayed
     assert group_dropdown.is_enabled
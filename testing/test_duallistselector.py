@@ -1,4 +1,7 @@
+import time
+
 import pytest
+from widgetastic.exceptions import NoSuchElementException
 from widgetastic.widget import View
 
 from widgetastic_patternfly4 import DualListSelector
@@ -166,3 +169,57 @@ def test_search(view):
     items = view.dual_list_selector_with_search._left_elements
     assert len(items) == 1
     assert items[0].text == "Option 1"
+
+
+def test_select_missing_items(view):
+    with pytest.raises(ValueError, match="Option 42.*Option 43"):
+        view.dual_list_selector.select(["Option 1", "Option 42", "Option 43"])
+    # nothing is selected if any of the items is missing
+    assert view.dual_list_selector.read(selected_only=True)["Available options"] == []
+
+
+def test_select_and_move_bulk(view, request):
+    @request.addfinalizer
+    def _finalizer():
+        view.dual_list_selector.move_all_items_left()
+
+    items = ["Option 1", "Option 3"]
+    view.dual_list_selector.select_and_move(items)
+    data = view.dual_list_selector.read()
+    assert data["Chosen options"] == items
+    assert not set(items) & set(data["Available options"])
+
+
+def test_search_wait(view, request):
+    @request.addfinalizer
+    def _finalizer():
+        view.dual_list_selector_with_search.search("")
+
+    assert view.dual_list_selector_with_search.search("Option 1") == ["Option 1"]
+    assert view.dual_list_selector_with_search.search("Option") == [
+        "Option 1",
+        "Option 2",
+        "Option 3",
+        "Option 4",
+    ]
+
+
+def test_search_unchanged_list(view):
+    selector = view.dual_list_selector_with_search
+    items = selector.search("")
+    # the input already holds the value
+    start = time.time()
+    assert selector.search("") == items
+    # every item matches, the list does not change
+    assert selector.search("Option") == items
+    assert time.time() - start < 3 * selector.SEARCH_CHANGE_TIMEOUT
+    selector.search("")
+
+
+def test_search_without_input(browser):
+    # the basic selector has no search inputs
+    selector = SearchDualListSelector(
+        browser, locator='.//div[@id="ws-react-c-dual-list-selector-basic"]'
+    )
+    with pytest.raises(NoSuchElementException):
+        selector.search("Option 1")
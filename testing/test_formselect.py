@@ -85,3 +85,16 @@ def test_formselect_fill_disabled_option(view):
 def test_formselect_fill_nonexistent_option(view):
     with pytest.raises(FormSelectOptionNotFound):
         view.input.fill("foo")
+
+
+def test_formselect_option_table(view):
+    table = view.input.option_table
+    assert [option.text for option in table] == view.input.all_options
+    assert [option.text for option in table if option.is_enabled] == view.input.all_enabled_options
+    mrs = next(option for option in table if option.text == "Mrs")
+    view.input.fill("Mr")
+    assert view.input.fill(mrs.value, by_value=True)
+    assert view.input.read() == "Mrs"
+    assert not view.input.fill("Mrs")
+    with pytest.raises(FormSelectOptionNotFound):
+        view.input.fill("foo", by_value=True)
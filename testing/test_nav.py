@@ -67,3 +67,35 @@ def test_navigation_select(browser):
     # try to select some bogus location and make sure proper exception is raised
     with pytest.raises(NavSelectionNotFound):
         nav.select("This location does not exist")
+    with pytest.raises(
+        NavSelectionNotFound, match="Deepest matched level: \\['Link 2 - expandable'\\]"
+    ):
+        nav.select("Link 2 - expandable", "This location does not exist")
+
+
+def test_navigation_tree_cache(browser):
+    class TestView(View):
+        ROOT = ".//div[@id='ws-react-c-navigation-mixed']"
+        nav = Navigation(locator="./nav")
+
+    nav = TestView(browser).nav
+    tree = nav._read_tree()
+    # served from the cache while the navigation does not change
+    assert nav._read_tree() is tree
+    assert nav.nav_links("Link 2 - expandable") == ["Link 1", "Link 2", "Link 3"]
+    nav.select("Link 2 - expandable", "Link 3")
+    assert nav._read_tree() is not tree
+    assert nav.nav_links("Link 2 - expandable") == ["Link 1", "Link 2", "Link 3"]
+
+
+def test_navigation_loaded_cache(browser):
+    class TestView(View):
+        ROOT = ".//div[@id='ws-react-c-navigation-default']"
+        nav = Navigation(locator="./nav")
+
+    nav = TestView(browser).nav
+    assert nav.loaded
+    token = nav._ouia_safe_token
+    assert nav.loaded
+    # data-ouia-safe did not flip, so the remembered state was used
+    assert nav._ouia_safe_token == token
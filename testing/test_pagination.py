@@ -1,12 +1,19 @@
 import contextlib
+import logging
+import math
+import threading
+from unittest import mock
 
 import pytest
 from wait_for import wait_for
 from widgetastic.widget import View
+from widgetastic.widget import Widget
 
 from widgetastic_patternfly4 import CompactPagination
 from widgetastic_patternfly4 import Pagination
 from widgetastic_patternfly4 import PaginationNavDisabled
+from widgetastic_patternfly4.pagination import BasePagination
+from widgetastic_patternfly4.pagination import read_table_sharded
 
 TESTING_PAGE_URL = "https://patternfly-react.surge.sh/components/pagination"
 
@@ -205,3 +212,163 @@ def test_pagination_is_enabled(disabled_paginator):
         assert not paginator.is_enabled
     else:
         assert paginator.is_enabled
+
+
+def test_state(paginator):
+    paginator.next_page()
+    state = paginator.state()
+    assert (state.first_item, state.last_item) == (21, 40)
+    assert state.total_items == 523
+    assert state.current_page == 2
+    assert state.total_pages == 27
+    assert state.per_page == 20
+    assert state.is_first_enabled
+    assert state.is_previous_enabled
+    assert state.is_next_enabled
+    assert state.is_last_enabled
+    with pytest.raises(AttributeError):
+        state.current_page = 3
+
+    with paginator.snapshot():
+        assert paginator.current_page == 2
+        assert paginator.displayed_items == (21, 40)
+        assert paginator.current_per_page == 20
+        assert paginator.is_enabled
+
+    # the last page does not show a full page, the per page value comes from the same script
+    paginator.last_page()
+    state = paginator.state()
+    assert (state.first_item, state.last_item) == (521, 523)
+    assert state.per_page == 20
+
+
+def test_random_access(paginator):
+    assert paginator[5] == 5
+    assert paginator.current_page == 5
+    assert paginator[-1] == 27
+    assert paginator.current_page == 27
+    assert paginator[2] == 2
+    assert paginator.current_page == 2
+    assert paginator.current_per_page == 20
+    with pytest.raises(IndexError):
+        paginator[28]
+
+
+def test_iter_pages(paginator):
+    pages = []
+    for page in paginator.iter_pages(1, 10, 3):
+        assert paginator.current_page == page
+        pages.append(page)
+    assert pages == [1, 4, 7]
+    assert list(paginator.iter_pages(step=-13)) == [27, 14, 1]
+
+
+class PageItems(Widget):
+    """Stand-in for a table, the rows of a page are the numbers of its displayed items."""
+
+    def iter_rows(self, columns=None):
+        first, last = self.parent.paginator.displayed_items
+        for item in range(first, last + 1):
+            yield {"item": item}
+
+
+def test_iter_table_rows(browser):
+    class TestView(View):
+        ROOT = ".//div[@id='ws-react-c-pagination-top']"
+        paginator = Pagination(locator="./div")
+        table = PageItems()
+
+    view = TestView(browser)
+    view.paginator.next_page()
+    try:
+        rows = list(view.paginator.iter_table_rows(view.table))
+        assert view.paginator.current_per_page == 100
+    finally:
+        with contextlib.suppress(PaginationNavDisabled):
+            view.paginator.first_page()
+        view.paginator.set_per_page(20)
+    # every item exactly once and in order, no page is skipped or read twice
+    assert rows == [(item,) for item in range(1, 524)]
+
+
+class StandInPagination(BasePagination):
+    """Stand-in for a pagination in a browser, a page change is rendered after a short delay."""
+
+    def __init__(self, total_items, per_page=20, delay=0.1):
+        self.total = total_items
+        self.per_page = per_page
+        self.page = 1
+        self.delay = delay
+
+    @property
+    def _items_text(self):
+        first = (self.page - 1) * self.per_page + 1
+        return f"{first} - {min(first + self.per_page - 1, self.total)} of {self.total} items"
+
+    @property
+    def current_page(self):
+        return self.page
+
+    @property
+    def total_pages(self):
+        return math.ceil(self.total / self.per_page)
+
+    @property
+    def current_per_page(self):
+        return self.per_page
+
+    @property
+    def largest_per_page(self):
+        return 100
+
+    def set_per_page(self, count):
+        self.per_page = count
+        self.page = 1
+
+    def _navigate(self, page, current_page=None):
+        threading.Timer(self.delay, setattr, (self, "page", page)).start()
+
+
+class StandInTable:
+    """Stand-in for a table, the rows of a page are the numbers of its displayed items."""
+
+    def __init__(self, pagination):
+        self.pagination = pagination
+
+    def iter_rows(self, columns=None):
+        first, last = self.pagination.displayed_items
+        for item in range(first, last + 1):
+            yield {"item": item}
+
+
+class StandInView:
+    def __init__(self, browser):
+        self.browser = browser
+        self.pagination = StandInPagination(523)
+        self.table = StandInTable(self.pagination)
+        self.logger = logging.getLogger(__name__)
+
+
+class StandInBrowser:
+    """Stand-in for a browser session, only records that it was quit."""
+
+    def __init__(self):
+        self.selenium = mock.Mock()
+
+
+def test_read_table_sharded():
+    browsers = []
+
+    def browser_factory():
+        browsers.append(StandInBrowser())
+        return browsers[-1]
+
+    view = StandInView(StandInBrowser())
+    rows, timings = read_table_sharded(view, browser_factory, StandInView, sessions=3)
+    # every item exactly once and in order, a shard does not read a page before it is rendered
+    assert rows == [(item,) for item in range(1, 524)]
+    assert [timing.pages for timing in timings] == [range(1, 3), range(3, 5), range(5, 7)]
+    assert [timing.rows for timing in timings] == [200, 200, 123]
+    assert len(browsers) == 2
+    assert all(browser.selenium.quit.called for browser in browsers)
+    assert not view.browser.selenium.quit.called
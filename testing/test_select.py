@@ -45,6 +45,27 @@ def test_select_item_select(select):
     assert not select.is_open
 
 
+@pytest.fixture
+def typeahead_select(browser):
+    class TestView(View):
+        ROOT = ".//div[@id='ws-react-c-select-typeahead']"
+        select = Select(locator=".//div[contains(@class, 'pf-c-select')]")
+
+    return TestView(browser).select
+
+
+def test_select_typeahead(typeahead_select):
+    assert typeahead_select.has_typeahead
+    typeahead_select.item_select("New York", use_typeahead=True)
+    assert not typeahead_select.is_open
+    value = typeahead_select.browser.get_attribute("value", typeahead_select.TYPEAHEAD_LOCATOR)
+    assert value == "New York"
+    with pytest.raises(SelectItemNotFound):
+        typeahead_select.item_select("Non existing item", use_typeahead=True)
+    # the typed filter does not stay in the input
+    assert not typeahead_select.browser.get_attribute("value", typeahead_select.TYPEAHEAD_LOCATOR)
+
+
 @pytest.fixture
 def checkbox_select(browser):
     class TestView(View):
@@ -105,3 +126,29 @@ def test_checkbox_select_item_checkbox_select(checkbox_select):
     with pytest.raises(SelectItemNotFound):
         checkbox_select.fill({"Non existing item": True})
     assert not checkbox_select.is_open
+
+
+def test_checkbox_select_fill_batch(checkbox_select):
+    assert checkbox_select.fill({"Paused": True, "Warning": True})
+    # nothing to change
+    assert not checkbox_select.fill({"Paused": True, "Warning": True, "Cancelled": False})
+    with pytest.raises(SelectItemNotFound, match="Non existing item"):
+        checkbox_select.fill({"Paused": False, "Non existing item": True})
+    # the existing items are filled even if some of the items are missing
+    assert checkbox_select.read()["Paused"] is False
+    assert checkbox_select.fill({"Warning": False})
+    assert not checkbox_select.is_open
+    # the label only has to start with the item, the same as for item_select
+    assert checkbox_select.fill({"Active": True})
+    assert checkbox_select.read()["Active This is a description"] is True
+    assert checkbox_select.fill({"Active": False})
+
+
+def test_checkbox_select_states(checkbox_select):
+    checkbox_select.fill({"Cancelled": True})
+    states = checkbox_select.checkbox_states
+    assert states.as_dict() == checkbox_select.read()
+    assert states.is_checked("Cancelled")
+    assert not states.is_checked("Paused")
+    checkbox_select.fill({"Cancelled": False})
+    assert checkbox_select.checkbox_states.checked == 0
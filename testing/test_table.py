@@ -348,3 +348,101 @@ def test_compound_expandable_table(browser, use_different_widgets):
     assert row1.branches.content.read() == row1_branches_read
     row1.branches.collapse()
     assert not row1.branches.is_expanded
+
+
+@pytest.mark.parametrize(
+    "table_cls, locator",
+    [
+        (
+            PatternflyTable,
+            ".//div[@id='ws-react-composable-c-table-composable-sortable--wrapping-headers']/table",
+        ),
+        (ExpandableTable, ".//div[@id='ws-react-composable-c-table-composable-expandable']/table"),
+        (CompoundExpandableTable, ".//table[@aria-label='Compound expandable table']"),
+    ],
+    ids=["patternfly", "expandable", "compound-expandable"],
+)
+def test_table_bulk_read(browser, table_cls, locator):
+    table = table_cls(browser, locator)
+    assert table.bulk_read() == table.read()
+
+
+TH_FIRST_TABLE = """
+    var div = document.createElement("div");
+    div.id = "wt-th-first";
+    div.innerHTML = "<table><thead><tr><th>Name</th><th>Branches</th><th>Pull requests</th>"
+        + "<th>Workspaces</th></tr></thead><tbody>"
+        + "<tr><th>one</th><td>two</td><td>three</td><td>four</td></tr>"
+        + "<tr><th>a</th><td>b</td><td>c</td><td>d</td></tr></tbody></table>";
+    document.body.appendChild(div);
+"""
+
+
+@pytest.fixture
+def th_first_table(browser):
+    # a <th> as the first cell of every row, the demo page has no such table
+    browser.execute_script(TH_FIRST_TABLE)
+    yield PatternflyTable(browser, ".//div[@id='wt-th-first']/table")
+    browser.execute_script("document.getElementById('wt-th-first').remove();")
+
+
+def test_table_bulk_read_th_first(th_first_table):
+    assert th_first_table.bulk_read() == th_first_table.read()
+    # the cells are mapped the same way as the <th> adjustment of the row widget does
+    assert th_first_table.bulk_read()[0]["Branches"] == th_first_table[0]["Branches"].read()
+
+
+def test_table_layout_cache(browser):
+    header = SORT[0][0]
+    table = PatternflyTable(
+        browser,
+        ".//div[@id='ws-react-composable-c-table-composable-sortable--wrapping-headers']/table",
+    )
+    table.sort_by(header, "ascending")
+    layout = table.refresh_layout()
+    assert table.refresh_layout() is layout
+    assert table.headers == layout["headers"]
+    assert len(layout["row_headers"]) == table.row_count
+
+    # re-ordering the rows re-renders the tbody, the row reads the new layout right away
+    table.sort_by(header, "descending")
+    has_row_header = table[0].has_row_header
+    assert table._layout is not layout
+    assert has_row_header == table._layout["row_headers"][0]
+
+
+def test_table_read_checks_layout_once(browser, monkeypatch):
+    table = PatternflyTable(
+        browser,
+        ".//div[@id='ws-react-composable-c-table-composable-sortable--wrapping-headers']/table",
+    )
+    calls = []
+    refresh_layout = table.refresh_layout
+
+    def _refresh_layout():
+        calls.append(None)
+        return refresh_layout()
+
+    monkeypatch.setattr(table, "refresh_layout", _refresh_layout)
+    table.read()
+    # once for the whole read, not for every cell
+    assert len(calls) == 1
+    table[0].read()
+    assert len(calls) == 2
+
+
+def test_table_read_columns(browser):
+    table = ExpandableTable(
+        browser, ".//div[@id='ws-react-composable-c-table-composable-expandable']/table"
+    )
+    columns = ["Repositories", "Pull requests"]
+    expected = [{column: row[column] for column in columns} for row in table.read()]
+    assert table.read(columns=columns) == expected
+    assert list(table.iter_rows(columns=columns)) == expected
+
+
+def test_table_read_columns_th_first(th_first_table):
+    columns = ["Name", "Pull requests"]
+    expected = [{column: row[column] for column in columns} for row in th_first_table.read()]
+    assert th_first_table.read(columns=columns) == expected
+    assert list(th_first_table.iter_rows(columns=columns)) == expected
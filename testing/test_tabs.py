@@ -111,3 +111,13 @@ def test_separate_content_tabs(browser):
     assert not view.separate.tab1.is_active()
     assert view.separate.tab2.is_active()
     assert view.separate.tab2.content.text == "Tab 2 section"
+
+
+def test_event_driven_select(browser, monkeypatch):
+    monkeypatch.setattr(Tab, "EVENT_DRIVEN_WAIT", True)
+    view = TabsTestView(browser)
+    view.primary.tab1.select()
+    assert view.primary.tab1.is_active()
+    view.primary.tab2.select()
+    assert view.primary.tab2.is_active()
+    assert not view.primary.tab1.is_active()